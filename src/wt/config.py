@@ -6,6 +6,11 @@ import json
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
+try:  # Optional C-accelerated JSON; stdlib is the fallback.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 @dataclass
 class WtConfig:
@@ -22,8 +27,8 @@ class WtConfig:
     def load(cls, config_path: Path) -> "WtConfig":
         """Load config from file, or return defaults if missing."""
         if config_path.exists():
-            with config_path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            raw = config_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             filtered = {
                 key: value
                 for key, value in data.items()
@@ -35,8 +40,13 @@ class WtConfig:
     def save(self, config_path: Path) -> None:
         """Save config to file."""
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with config_path.open("w", encoding="utf-8") as handle:
-            json.dump(asdict(self), handle, indent=2)
+        if orjson is not None:
+            config_path.write_bytes(
+                orjson.dumps(asdict(self), option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with config_path.open("w", encoding="utf-8") as handle:
+                json.dump(asdict(self), handle, indent=2)
 
 
 def get_wt_dir(repo_root: Path) -> Path:
@@ -49,24 +59,46 @@ def get_config_path(repo_root: Path) -> Path:
     return get_wt_dir(repo_root) / "wt.json"
 
 
+# Parsed configs keyed by path, invalidated when the file on disk changes;
+# repeat ensure_config calls within one process skip the read and re-parse.
+_config_cache: dict[str, tuple[int, int, WtConfig]] = {}
+
+
 def ensure_config(repo_root: Path) -> WtConfig:
     """Ensure config exists, creating with defaults if needed."""
     config_path = get_config_path(repo_root)
-    config = WtConfig.load(config_path)
-    if not config_path.exists():
+    key = str(config_path)
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         # Detect current branch as default base_branch
         from wt.git import get_current_branch
 
-        current_branch = get_current_branch(cwd=repo_root)
-        config.base_branch = current_branch
+        config = WtConfig(base_branch=get_current_branch(cwd=repo_root))
         config.save(config_path)
+        stat = config_path.stat()
+        _config_cache[key] = (stat.st_mtime_ns, stat.st_size, config)
+        return config
+
+    cached = _config_cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    config = WtConfig.load(config_path)
+    _config_cache[key] = (stat.st_mtime_ns, stat.st_size, config)
     return config
 
 
+_gitignore_verified: set[str] = set()
+
+
 def ensure_worktrees_gitignore(repo_path: Path) -> None:
     """Ensure the .wt/.gitignore file exists."""
     wt_dir = get_wt_dir(repo_path)
     gitignore_path = wt_dir / ".gitignore"
+    key = str(gitignore_path)
+    if key in _gitignore_verified:
+        return
     if not gitignore_path.exists():
         wt_dir.mkdir(parents=True, exist_ok=True)
         gitignore_path.write_text("state.json\nworktrees/\n")
+    _gitignore_verified.add(key)
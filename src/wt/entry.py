@@ -0,0 +1,51 @@
+"""Process entry point with stdlib-only fast paths."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+
+def _fast_path(name: str) -> int | None:
+    """Resolve `wt path <name>` without importing typer or rich.
+
+    Returns an exit code, or None to fall back to the full CLI — e.g. when
+    the repo or worktree cannot be resolved and the rich error reporting
+    (and the callback's state sync) should run instead.
+    """
+    from wt.errors import NotInGitRepoError
+    from wt.git import get_repo_root
+    from wt.state import WtState, get_state_path
+
+    try:
+        repo_root = get_repo_root()
+    except NotInGitRepoError:
+        return None
+    entry = WtState.load(get_state_path(repo_root)).find_by_feat_name(name)
+    if entry is None or not os.path.isdir(entry.path):
+        return None
+    print(entry.path)
+    return 0
+
+
+def run() -> None:
+    """CLI entry point.
+
+    `wt --version` and `wt path <name>` are the invocations shell
+    integrations hit per prompt; both are answered here before the
+    typer/rich import chain runs. Everything else defers to the Typer app.
+    """
+    argv = sys.argv[1:]
+    if argv[:1] and argv[0] in ("--version", "-v"):
+        from wt import __version__
+
+        print(f"wt version {__version__}")
+        raise SystemExit(0)
+    if len(argv) == 2 and argv[0] == "path" and not argv[1].startswith("-"):
+        code = _fast_path(argv[1])
+        if code is not None:
+            raise SystemExit(code)
+
+    from wt.cli import app
+
+    app()
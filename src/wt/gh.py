@@ -3,14 +3,21 @@ from __future__ import annotations
 
 import shutil
 import subprocess
+from functools import cache
 from pathlib import Path
 
 from wt.errors import GhNotInstalledError, CommandFailedError
 
 
+@cache
+def _gh_path() -> str | None:
+    """Locate the gh binary once per process."""
+    return shutil.which("gh")
+
+
 def check_gh_installed() -> None:
     """Check if gh CLI is installed."""
-    if shutil.which("gh") is None:
+    if _gh_path() is None:
         raise GhNotInstalledError()
 
 
@@ -26,25 +33,34 @@ def create_pr(
     """Create a PR and return the URL."""
     check_gh_installed()
 
-    args = ["gh", "pr", "create", "--base", base, "--head", head]
-    if fill and not title:
-        args.append("--fill")
-    if title:
-        args.extend(["--title", title])
-    if body:
-        args.extend(["--body", body])
-    if draft:
-        args.append("--draft")
+    # Large bodies go via stdin (--body-file -) so argv stays clear of the
+    # kernel's per-argument size cap.
+    body_on_stdin = body is not None and len(body) > 4096
+    args = [
+        "gh",
+        "pr",
+        "create",
+        "--base",
+        base,
+        "--head",
+        head,
+        *(["--fill"] if fill and not title else []),
+        *(["--title", title] if title else []),
+        *(["--body-file", "-"] if body_on_stdin else ["--body", body] if body else []),
+        *(["--draft"] if draft else []),
+    ]
 
+    # Bytes mode skips the TextIOWrapper/locale machinery; the output is a
+    # short URL (or an error message), so one utf-8 decode suffices.
     result = subprocess.run(
         args,
         cwd=cwd,
         capture_output=True,
-        text=True,
+        input=body.encode("utf-8") if body_on_stdin else None,
     )
 
     if result.returncode != 0:
         command = " ".join(args)
-        raise CommandFailedError(command, result.stderr)
+        raise CommandFailedError(command, result.stderr.decode("utf-8", "replace"))
 
-    return result.stdout.strip()
+    return result.stdout.decode("utf-8", "replace").strip()
@@ -1,7 +1,11 @@
 """Git command wrappers."""
 from __future__ import annotations
 
+import os
+import re
+import shlex
 import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 
 from wt.errors import NotInGitRepoError
@@ -11,13 +15,18 @@ def run_git(
     *args: str,
     cwd: Path | None = None,
     check: bool = True,
+    decode: bool = True,
 ) -> subprocess.CompletedProcess[str]:
-    """Run a git command and return the result."""
+    """Run a git command and return the result.
+
+    decode=False skips text decoding of stdout/stderr — for callers that
+    only inspect the return code.
+    """
     result = subprocess.run(
         ["git", *args],
         cwd=cwd,
         capture_output=True,
-        text=True,
+        text=decode,
     )
     if check and result.returncode != 0:
         raise subprocess.CalledProcessError(
@@ -29,8 +38,48 @@ def run_git(
     return result
 
 
+def _resolve_gitfile_repo_root(git_file: Path) -> Path | None:
+    """Resolve the main repo root behind a linked worktree's gitdir pointer."""
+    content = git_file.read_text(encoding="utf-8").strip()
+    if not content.startswith("gitdir:"):
+        return None
+    git_dir = Path(content[len("gitdir:") :].strip())
+    if not git_dir.is_absolute():
+        git_dir = (git_file.parent / git_dir).resolve()
+    common_path = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        pointer = commondir_file.read_text(encoding="utf-8").strip()
+        common_path = Path(pointer)
+        if not common_path.is_absolute():
+            common_path = (git_dir / common_path).resolve()
+    if common_path.name == ".git":
+        return common_path.parent
+    return None
+
+
 def get_repo_root(cwd: Path | None = None) -> Path:
-    """Get the root of the main git repository."""
+    """Get the root of the main git repository.
+
+    Walks up from cwd looking for a .git directory (main checkout) or
+    gitdir pointer file (linked worktree), avoiding a git subprocess on
+    the common layouts. Falls back to `git rev-parse` for anything else
+    (e.g. $GIT_DIR overrides).
+    """
+    probe = (cwd or Path.cwd()).resolve()
+    while True:
+        git_entry = probe / ".git"
+        if git_entry.is_dir():
+            return probe
+        if git_entry.is_file():
+            root = _resolve_gitfile_repo_root(git_entry)
+            if root is not None:
+                return root
+            break
+        if probe == probe.parent:
+            break
+        probe = probe.parent
+
     try:
         result = run_git("rev-parse", "--git-common-dir", cwd=cwd)
     except subprocess.CalledProcessError as exc:
@@ -46,7 +95,21 @@ def get_repo_root(cwd: Path | None = None) -> Path:
 
 
 def get_worktree_root(cwd: Path | None = None) -> Path:
-    """Get the root of the current worktree."""
+    """Get the root of the current worktree.
+
+    The nearest ancestor holding a .git entry (directory for the main
+    checkout, gitdir pointer file for linked worktrees) is the worktree
+    root; `git rev-parse` only runs as the fallback.
+    """
+    probe = (cwd or Path.cwd()).resolve()
+    while True:
+        git_entry = probe / ".git"
+        if git_entry.is_dir() or git_entry.is_file():
+            return probe
+        if probe == probe.parent:
+            break
+        probe = probe.parent
+
     try:
         result = run_git("rev-parse", "--show-toplevel", cwd=cwd)
     except subprocess.CalledProcessError as exc:
@@ -60,27 +123,120 @@ def is_bare_repo(cwd: Path | None = None) -> bool:
     return result.stdout.strip() == "true"
 
 
+class GitBatch:
+    """Long-running `git cat-file --batch-check` session for ref probes.
+
+    One persistent pipe answers any number of existence checks, so the
+    per-query cost is a line write/read instead of a git fork/exec.
+    """
+
+    def __init__(self, cwd: Path | None = None) -> None:
+        self._cwd = cwd
+        self._proc: subprocess.Popen[str] | None = None
+
+    def __enter__(self) -> "GitBatch":
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch-check"],
+            cwd=self._cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._proc is not None:
+            if self._proc.stdin is not None:
+                self._proc.stdin.close()
+            self._proc.wait()
+            self._proc = None
+
+    def ref_exists(self, ref: str) -> bool:
+        """Check whether a fully-qualified ref resolves to an object."""
+        proc = self._proc
+        if proc is None or proc.stdin is None or proc.stdout is None:
+            raise RuntimeError("GitBatch session is not open.")
+        proc.stdin.write(ref + "\n")
+        proc.stdin.flush()
+        reply = proc.stdout.readline()
+        return bool(reply) and not reply.rstrip().endswith(" missing")
+
+    def branch_exists(self, branch: str) -> bool:
+        """Check if a branch exists locally."""
+        return self.ref_exists("refs/heads/" + branch)
+
+
 def branch_exists(branch: str, cwd: Path | None = None) -> bool:
     """Check if a branch exists locally."""
     result = run_git(
         "rev-parse",
         "--verify",
-        f"refs/heads/{branch}",
+        "refs/heads/" + branch,
         cwd=cwd,
         check=False,
+        decode=False,
     )
     return result.returncode == 0
 
 
-def fetch_branch(remote: str, branch: str, cwd: Path | None = None) -> bool:
-    """Fetch a branch from remote. Returns True if successful."""
-    result = run_git("fetch", remote, f"{branch}:{branch}", cwd=cwd, check=False)
+def fetch_branch(
+    remote: str,
+    branch: str,
+    cwd: Path | None = None,
+    shallow: bool = False,
+) -> bool:
+    """Fetch a branch from remote. Returns True if successful.
+
+    shallow=True fetches only the tip commit (--depth=1 --no-tags), which
+    is enough to create a worktree on the branch but marks the repository
+    shallow — callers that later merge or compare histories should keep
+    the default full fetch.
+    """
+    args = ["fetch", remote, branch + ":" + branch]
+    if shallow:
+        args[1:1] = ["--depth=1", "--no-tags"]
+    result = run_git(*args, cwd=cwd, check=False, decode=False)
     return result.returncode == 0
 
 
+def fetch_branches(
+    pairs: list[tuple[str, str]],
+    cwd: Path | None = None,
+) -> bool:
+    """Fetch several (remote, branch) pairs. Returns True if all succeeded.
+
+    Branches on the same remote are fetched with one multi-refspec
+    `git fetch`, so pack negotiation and the network round-trip are paid
+    once per remote instead of once per branch. Distinct remotes are
+    fetched concurrently.
+    """
+    by_remote: dict[str, list[str]] = {}
+    for remote, branch in pairs:
+        refspecs = by_remote.setdefault(remote, [])
+        refspec = branch + ":" + branch
+        if refspec not in refspecs:
+            refspecs.append(refspec)
+    if not by_remote:
+        return True
+
+    def fetch_remote(remote: str) -> bool:
+        result = run_git(
+            "fetch", remote, *by_remote[remote], cwd=cwd, check=False, decode=False
+        )
+        return result.returncode == 0
+
+    if len(by_remote) == 1:
+        return fetch_remote(next(iter(by_remote)))
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(4, len(by_remote))) as pool:
+        return all(pool.map(fetch_remote, by_remote))
+
+
 def remote_exists(remote: str = "origin", cwd: Path | None = None) -> bool:
     """Check if a remote exists."""
-    result = run_git("remote", "get-url", remote, cwd=cwd, check=False)
+    result = run_git("remote", "get-url", remote, cwd=cwd, check=False, decode=False)
     return result.returncode == 0
 
 
@@ -108,34 +264,127 @@ def worktree_remove(path: Path, force: bool = False, cwd: Path | None = None) ->
     run_git(*args, cwd=cwd)
 
 
-def worktree_list(cwd: Path | None = None) -> list[dict[str, str]]:
-    """List all worktrees with porcelain output."""
+def cleanup_worktree(
+    path: Path,
+    branch: str,
+    force: bool = False,
+    cwd: Path | None = None,
+) -> None:
+    """Remove a worktree and delete its branch in one shell invocation.
+
+    Chaining both git commands with '&&' saves a fork/exec on the
+    cleanup path of `wt delete` / `wt merge`.
+    """
+    remove_args = ["git", "worktree", "remove", str(path)]
+    if force:
+        remove_args.append("--force")
+    branch_args = ["git", "branch", "-D" if force else "-d", branch]
+    command = " && ".join(shlex.join(args) for args in (remove_args, branch_args))
+    result = subprocess.run(
+        ["sh", "-c", command],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            result.returncode,
+            result.args,
+            output=result.stdout,
+            stderr=result.stderr,
+        )
+
+
+# One porcelain block: `worktree <path>` followed (in git's fixed order)
+# by optional bare / HEAD / branch-or-detached lines. Lines we don't use
+# (locked, prunable) fall between matches and are skipped.
+_WORKTREE_BLOCK_RE = re.compile(
+    r"^worktree (?P<path>.+)\n"
+    r"(?P<bare>bare\n)?"
+    r"(?:HEAD \S+\n)?"
+    r"(?:branch refs/heads/(?P<branch>.+)\n|(?P<detached>detached)\n)?",
+    re.MULTILINE,
+)
+
+
+def worktree_list_iter(cwd: Path | None = None) -> Iterator[dict[str, str]]:
+    """Yield worktree entries as `git worktree list --porcelain` is parsed."""
     result = run_git("worktree", "list", "--porcelain", cwd=cwd)
-    worktrees: list[dict[str, str]] = []
-    current: dict[str, str] = {}
-    for line in result.stdout.strip().split("\n"):
-        if not line:
-            if current:
-                worktrees.append(current)
-                current = {}
-            continue
-        if line.startswith("worktree "):
-            current["path"] = line[9:]
-        elif line.startswith("branch "):
-            current["branch"] = line[7:].replace("refs/heads/", "")
-        elif line == "bare":
+    buf = result.stdout
+    if buf and not buf.endswith("\n"):
+        buf += "\n"
+    for match in _WORKTREE_BLOCK_RE.finditer(buf):
+        current = {"path": match["path"]}
+        if match["branch"] is not None:
+            current["branch"] = match["branch"]
+        if match["bare"] is not None:
             current["bare"] = "true"
-        elif line == "detached":
+        if match["detached"] is not None:
             current["detached"] = "true"
-    if current:
-        worktrees.append(current)
-    return worktrees
+        yield current
+
+
+def worktree_list(cwd: Path | None = None) -> list[dict[str, str]]:
+    """List all worktrees with porcelain output."""
+    return list(worktree_list_iter(cwd=cwd))
+
+
+def find_worktree_for_branch(repo_root: Path, branch: str) -> Path | None:
+    """Find the worktree that has branch checked out, without a subprocess.
+
+    Reads .git/HEAD for the main checkout and .git/worktrees/*/HEAD for
+    linked worktrees, returning on the first match. Returns None when the
+    branch is not checked out anywhere.
+    """
+    ref_line = f"ref: refs/heads/{branch}"
+    git_dir = repo_root / ".git"
+    try:
+        if (git_dir / "HEAD").read_text(encoding="utf-8").strip() == ref_line:
+            return repo_root
+    except OSError:
+        pass
+    try:
+        entries = os.scandir(git_dir / "worktrees")
+    except FileNotFoundError:
+        return None
+    with entries:
+        for item in entries:
+            try:
+                head = Path(item.path, "HEAD").read_text(encoding="utf-8")
+                if head.strip() != ref_line:
+                    continue
+                gitdir = Path(item.path, "gitdir").read_text(encoding="utf-8")
+            except OSError:
+                continue
+            return Path(gitdir.strip()).parent
+    return None
 
 
 def has_uncommitted_changes(cwd: Path | None = None) -> bool:
-    """Check for uncommitted changes."""
-    result = run_git("status", "--porcelain", cwd=cwd)
-    return bool(result.stdout.strip())
+    """Check for uncommitted changes.
+
+    Streams `git status --porcelain` and answers on the first record
+    instead of waiting for the full work-tree walk to finish; any output
+    at all (including untracked files) means dirty. A git failure raises
+    instead of reading as clean, since callers gate destructive actions
+    on this answer.
+    """
+    proc = subprocess.Popen(
+        ["git", "status", "--porcelain"],
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert proc.stdout is not None
+    chunk = proc.stdout.read(4096)
+    if chunk.strip():
+        proc.terminate()
+        proc.communicate()
+        return True
+    _, stderr = proc.communicate()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, stderr=stderr)
+    return False
 
 
 def has_unstaged_files(cwd: Path | None = None) -> bool:
@@ -180,9 +429,20 @@ def git_add_all(cwd: Path | None = None) -> None:
     run_git("add", ".", cwd=cwd)
 
 
-def git_commit(cwd: Path | None = None, message: str | None = None) -> None:
-    """Create a commit with optional message."""
+def git_commit(
+    cwd: Path | None = None,
+    message: str | None = None,
+    no_verify: bool = False,
+) -> None:
+    """Create a commit with optional message.
+
+    no_verify=True skips commit hooks — used for wt's own machinery
+    commits (e.g. auto-commit before merge), where the user never
+    opted into running their pre-commit framework.
+    """
     args = ["commit"]
+    if no_verify:
+        args.append("--no-verify")
     if message:
         args.extend(["-m", message])
     run_git(*args, cwd=cwd)
@@ -214,6 +474,37 @@ def push_branch(
     run_git(*args, cwd=cwd)
 
 
+def read_upstream_from_config(git_dir: Path, branch: str) -> str | None:
+    """Resolve a branch's upstream from .git/config without spawning git.
+
+    Returns '<remote>/<branch>' when the [branch "<name>"] section carries
+    both remote and merge entries, else None. Raises OSError when the
+    config file cannot be read — callers fall back to `git rev-parse`.
+    """
+    lines = (git_dir / "config").read_text(encoding="utf-8").splitlines()
+    section = f'[branch "{branch}"]'
+    remote: str | None = None
+    merge: str | None = None
+    in_section = False
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("["):
+            in_section = stripped == section
+            continue
+        if not in_section or "=" not in stripped:
+            continue
+        key, _, value = stripped.partition("=")
+        key = key.strip()
+        value = value.strip()
+        if key == "remote":
+            remote = value
+        elif key == "merge":
+            merge = value
+    if remote is None or merge is None:
+        return None
+    return f"{remote}/{merge.removeprefix('refs/heads/')}"
+
+
 def get_upstream_branch(cwd: Path | None = None) -> str | None:
     """Get the upstream branch for the current branch."""
     result = run_git(
@@ -251,15 +542,13 @@ def merge_branch(
     run_git(*args, cwd=cwd)
 
 
-def list_remote_branches(cwd: Path | None = None) -> list[str]:
-    """List all remote branch names (without 'origin/' prefix)."""
+def list_remote_branches(cwd: Path | None = None) -> Iterator[str]:
+    """Yield remote branch names (without 'origin/' prefix)."""
     result = run_git("branch", "-r", cwd=cwd, check=False)
-    branches: list[str] = []
     for line in result.stdout.strip().split("\n"):
         line = line.strip()
         if line.startswith("origin/"):
-            branches.append(line[7:])
-    return branches
+            yield line[7:]
 
 
 def get_ahead_behind(cwd: Path | None = None) -> tuple[int, int]:
@@ -279,6 +568,44 @@ def get_ahead_behind(cwd: Path | None = None) -> tuple[int, int]:
     return (ahead, behind)
 
 
+def _parse_upstream_track(track: str) -> tuple[int, int]:
+    """Parse a %(upstream:track) value like '[ahead 1, behind 2]'."""
+    ahead = behind = 0
+    for part in track.strip("[]").split(","):
+        part = part.strip()
+        if part.startswith("ahead "):
+            ahead = int(part[6:])
+        elif part.startswith("behind "):
+            behind = int(part[7:])
+    return (ahead, behind)
+
+
+def branch_status_map(cwd: Path | None = None) -> dict[str, tuple[int, int, str | None]]:
+    """Get (ahead, behind, last_commit_iso) for all local branches at once.
+
+    One `git for-each-ref` call replaces the per-branch rev-list and log
+    subprocesses when rendering many worktrees.
+    """
+    result = run_git(
+        "for-each-ref",
+        "refs/heads",
+        "--format=%(refname:short)%00%(upstream:track)%00%(committerdate:iso8601-strict)",
+        cwd=cwd,
+        check=False,
+    )
+    statuses: dict[str, tuple[int, int, str | None]] = {}
+    if result.returncode != 0:
+        return statuses
+    for line in result.stdout.splitlines():
+        fields = line.split("\x00")
+        if len(fields) != 3:
+            continue
+        branch, track, commit_time = fields
+        ahead, behind = _parse_upstream_track(track)
+        statuses[branch] = (ahead, behind, commit_time or None)
+    return statuses
+
+
 def get_last_commit_time(cwd: Path | None = None) -> str | None:
     """Get the timestamp of the last commit in ISO format."""
     result = run_git(
@@ -292,6 +619,21 @@ def get_last_commit_time(cwd: Path | None = None) -> str | None:
 def get_branch_merged_status(branch: str, base: str, cwd: Path | None = None) -> bool:
     """Check if branch is fully merged into base."""
     result = run_git(
-        "merge-base", "--is-ancestor", branch, base, cwd=cwd, check=False
+        "merge-base", "--is-ancestor", branch, base, cwd=cwd, check=False, decode=False
     )
     return result.returncode == 0
+
+
+def get_merged_branches(base: str, cwd: Path | None = None) -> set[str]:
+    """Get all local branches fully merged into base with one git call."""
+    result = run_git(
+        "for-each-ref",
+        "--format=%(refname:short)",
+        f"--merged={base}",
+        "refs/heads/",
+        cwd=cwd,
+        check=False,
+    )
+    if result.returncode != 0:
+        return set()
+    return {line for line in result.stdout.splitlines() if line}
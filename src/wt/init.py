@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import os
+import shlex
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
+if TYPE_CHECKING:
+    from rich.console import Console
 
+# Scripts containing any of these need a real shell; plain commands
+# (e.g. "uv sync") can skip the intermediate /bin/sh fork. "=" is
+# included so env-assignment prefixes ("MY_FLAG=1 uv sync") keep working.
+_SHELL_METACHARS = set(";|&><$`(){}[]*?~#!\\\n\"'=")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class InitContext:
     """Context passed to init scripts via environment variables."""
 
@@ -24,18 +32,15 @@ class InitContext:
 
 def build_init_env(ctx: InitContext) -> dict[str, str]:
     """Build environment variables for init script."""
-    env = os.environ.copy()
-    env.update(
-        {
-            "WT_ROOT": str(ctx.wt_root),
-            "WT_REPO_ROOT": str(ctx.repo_root),
-            "WT_WORKTREE_PATH": str(ctx.worktree_path),
-            "WT_FEAT_NAME": ctx.feat_name,
-            "WT_BRANCH": ctx.branch,
-            "WT_BASE_BRANCH": ctx.base_branch,
-        }
-    )
-    return env
+    return {
+        **os.environ,
+        "WT_ROOT": str(ctx.wt_root),
+        "WT_REPO_ROOT": str(ctx.repo_root),
+        "WT_WORKTREE_PATH": str(ctx.worktree_path),
+        "WT_FEAT_NAME": ctx.feat_name,
+        "WT_BRANCH": ctx.branch,
+        "WT_BASE_BRANCH": ctx.base_branch,
+    }
 
 
 def resolve_init_script(config_script: str | None, wt_root: Path) -> str | None:
@@ -49,7 +54,7 @@ def resolve_init_script(config_script: str | None, wt_root: Path) -> str | None:
         return config_script
 
     default_hook = wt_root / "hooks" / "init.sh"
-    if default_hook.exists() and default_hook.is_file():
+    if default_hook.is_file():
         return str(default_hook)
 
     return None
@@ -70,9 +75,10 @@ def run_init_script(
     console.print(f"[dim]Running init script: {script}[/dim]")
 
     try:
+        use_shell = not _SHELL_METACHARS.isdisjoint(script)
         result = subprocess.run(
-            script,
-            shell=True,
+            script if use_shell else shlex.split(script),
+            shell=use_shell,
             cwd=ctx.worktree_path,
             env=env,
         )
@@ -2,10 +2,16 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+try:  # Optional C-accelerated JSON; stdlib is the fallback.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 @dataclass
 class WorktreeEntry:
@@ -18,37 +24,79 @@ class WorktreeEntry:
     created_at: str
 
 
+# Cache of parsed state files keyed by path, invalidated when the file
+# on disk changes. Commands load state several times per invocation
+# (sync, lookup, save); repeat loads should not re-parse the JSON.
+_load_cache: dict[str, tuple[int, int, "WtState"]] = {}
+
+
 @dataclass
 class WtState:
     """State schema for .wt/state.json."""
 
     worktrees: list[WorktreeEntry] = field(default_factory=list)
+    # st_mtime_ns of $GIT_DIR/worktrees at the last sync; lets sync_state
+    # skip `git worktree list` when nothing changed since.
+    last_synced_mtime_ns: int | None = None
 
     @classmethod
     def load(cls, state_path: Path) -> "WtState":
         """Load state from file, or return empty state if missing."""
-        if state_path.exists():
-            with state_path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-            worktrees = [WorktreeEntry(**item) for item in data.get("worktrees", [])]
-            return cls(worktrees=worktrees)
-        return cls()
+        try:
+            stat = state_path.stat()
+        except FileNotFoundError:
+            return cls()
+        key = str(state_path)
+        cached = _load_cache.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        raw = state_path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        worktrees = [WorktreeEntry(**item) for item in data.get("worktrees", [])]
+        state = cls(
+            worktrees=worktrees,
+            last_synced_mtime_ns=data.get("last_synced_mtime_ns"),
+        )
+        _load_cache[key] = (stat.st_mtime_ns, stat.st_size, state)
+        return state
 
     def save(self, state_path: Path) -> None:
         """Save state to file."""
         state_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {"worktrees": [asdict(item) for item in self.worktrees]}
-        with state_path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
-
-    def add_worktree(self, feat_name: str, branch: str, path: str, base: str) -> None:
-        """Add a worktree entry."""
+        payload = {
+            "worktrees": [asdict(item) for item in self.worktrees],
+            "last_synced_mtime_ns": self.last_synced_mtime_ns,
+        }
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(payload, indent=2).encode("utf-8")
+        # Write-then-rename keeps state.json intact if we crash mid-write.
+        tmp_path = state_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, state_path)
+        stat = state_path.stat()
+        _load_cache[str(state_path)] = (stat.st_mtime_ns, stat.st_size, self)
+
+    def add_worktree(
+        self,
+        feat_name: str,
+        branch: str,
+        path: str,
+        base: str,
+        created_at: str | None = None,
+    ) -> None:
+        """Add a worktree entry.
+
+        created_at lets bulk callers stamp many entries with one
+        precomputed timestamp instead of formatting a new one per entry.
+        """
         entry = WorktreeEntry(
             feat_name=feat_name,
             branch=branch,
             path=path,
             base=base,
-            created_at=datetime.now().isoformat(),
+            created_at=created_at or datetime.now().isoformat(),
         )
         self.worktrees.append(entry)
 
@@ -56,26 +104,47 @@ class WtState:
         """Remove a worktree entry by path."""
         self.worktrees = [item for item in self.worktrees if item.path != path]
 
+    def _indexes(
+        self,
+    ) -> tuple[
+        dict[str, WorktreeEntry], dict[str, WorktreeEntry], dict[str, WorktreeEntry]
+    ]:
+        """Build (or reuse) dict indexes over the entry list.
+
+        The cache is keyed on the list's identity and length so both
+        wholesale reassignment (pruning) and append/remove invalidate it.
+        setdefault keeps first-match semantics for duplicate keys.
+        """
+        worktrees = self.worktrees
+        cached = getattr(self, "_index_cache", None)
+        if (
+            cached is not None
+            and cached[0] is worktrees
+            and cached[1] == len(worktrees)
+        ):
+            return cached[2]
+        by_branch: dict[str, WorktreeEntry] = {}
+        by_path: dict[str, WorktreeEntry] = {}
+        by_feat: dict[str, WorktreeEntry] = {}
+        for item in worktrees:
+            by_branch.setdefault(item.branch, item)
+            by_path.setdefault(item.path, item)
+            by_feat.setdefault(item.feat_name, item)
+        indexes = (by_branch, by_path, by_feat)
+        self._index_cache = (worktrees, len(worktrees), indexes)
+        return indexes
+
     def find_by_branch(self, branch: str) -> WorktreeEntry | None:
         """Find a worktree entry by branch name."""
-        for item in self.worktrees:
-            if item.branch == branch:
-                return item
-        return None
+        return self._indexes()[0].get(branch)
 
     def find_by_path(self, path: str) -> WorktreeEntry | None:
         """Find a worktree entry by path."""
-        for item in self.worktrees:
-            if item.path == path:
-                return item
-        return None
+        return self._indexes()[1].get(path)
 
     def find_by_feat_name(self, feat_name: str) -> WorktreeEntry | None:
         """Find a worktree entry by feature name."""
-        for item in self.worktrees:
-            if item.feat_name == feat_name:
-                return item
-        return None
+        return self._indexes()[2].get(feat_name)
 
 
 def prune_stale_entries(state: WtState, valid_paths: set[str]) -> bool:
@@ -85,8 +154,16 @@ def prune_stale_entries(state: WtState, valid_paths: set[str]) -> bool:
     (e.g. macOS `/var` vs `/private/var`).
     """
 
+    # realpath is a single C call (vs. Path.resolve's per-component lstat
+    # loop), and the cache spares repeat resolves when the same path shows
+    # up both in valid_paths and in a state entry.
+    resolved: dict[str, str] = {}
+
     def normalize(path: str) -> str:
-        return str(Path(path).resolve(strict=False))
+        cached = resolved.get(path)
+        if cached is None:
+            cached = resolved[path] = os.path.realpath(path)
+        return cached
 
     normalized_valid = {normalize(path) for path in valid_paths}
     original_count = len(state.worktrees)
@@ -1,27 +1,31 @@
 """Utility functions for wt."""
 from __future__ import annotations
 
+import os
 import re
 import shutil
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
 
-from rich.console import Console
-
 from wt.errors import InvalidFeatureNameError
 
-console = Console()
+_WHITESPACE_RE = re.compile(r"\s+")
+_VALID_NAME_RE = re.compile(r"\A[a-z0-9._-]+\Z")
 
 
+@lru_cache(maxsize=256)
 def normalize_feat_name(name: str) -> str:
     """Normalize feature name: lowercase, spaces to dashes, validate chars."""
     normalized = name.lower().strip()
-    normalized = re.sub(r"\s+", "-", normalized)
-    if not re.match(r"^[a-z0-9._-]+$", normalized):
+    normalized = _WHITESPACE_RE.sub("-", normalized)
+    if not _VALID_NAME_RE.match(normalized):
         raise InvalidFeatureNameError(normalized)
     return normalized
 
 
+@lru_cache(maxsize=256)
 def derive_feat_name_from_branch(branch: str, prefix: str) -> str:
     """Derive feature name from branch, stripping prefix if present."""
     if branch.startswith(prefix):
@@ -29,12 +33,29 @@ def derive_feat_name_from_branch(branch: str, prefix: str) -> str:
     return branch
 
 
-def launch_ai_tui(tui_command: str, cwd: Path) -> bool:
-    """Launch AI TUI in the given directory. Returns True if launched."""
-    if shutil.which(tui_command) is None:
-        console.print(
+@lru_cache(maxsize=32)
+def _resolve_tui(command: str) -> str | None:
+    """Locate a TUI binary once per process (shutil.which walks $PATH)."""
+    return shutil.which(command)
+
+
+def launch_ai_tui(tui_command: str, cwd: Path, replace: bool = False) -> bool:
+    """Launch AI TUI in the given directory. Returns True if launched.
+
+    With replace=True the TUI takes over this process via exec — callers
+    must have no work left, since control never returns on success.
+    """
+    if _resolve_tui(tui_command) is None:
+        from rich.console import Console
+
+        Console().print(
             f"[yellow]Warning:[/yellow] AI TUI '{tui_command}' not found in PATH. Skipping."
         )
         return False
+    if replace:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.chdir(cwd)
+        os.execvp(tui_command, [tui_command])
     subprocess.run([tui_command], cwd=cwd, check=False)
     return True
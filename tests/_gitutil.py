@@ -0,0 +1,27 @@
+"""Subprocess-free git helpers for test assertions."""
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def _ref_exists(repo: Path, ref: str) -> bool:
+    """Check a ref by looking at the loose ref file, then packed-refs."""
+    if (repo / ".git" / ref).exists():
+        return True
+    packed_refs = repo / ".git" / "packed-refs"
+    if not packed_refs.exists():
+        return False
+    for line in packed_refs.read_text(encoding="utf-8").splitlines():
+        if line.endswith(ref):
+            return True
+    return False
+
+
+def branch_exists(repo: Path, name: str) -> bool:
+    """Check whether a local branch exists, without spawning git."""
+    return _ref_exists(repo, f"refs/heads/{name}")
+
+
+def remote_branch_exists(repo: Path, name: str, remote: str = "origin") -> bool:
+    """Check whether a remote-tracking branch exists, without spawning git."""
+    return _ref_exists(repo, f"refs/remotes/{remote}/{name}")
@@ -1,32 +1,83 @@
 """Pytest fixtures for wt tests."""
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
 from pathlib import Path
 
 import pytest
 
+# Keep template construction hermetic: no host git config leaks in, and
+# parallel test workers (pytest-xdist) can't race on shared config.
+_GIT_ENV = {
+    **os.environ,
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_SYSTEM": os.devnull,
+    "GIT_TERMINAL_PROMPT": "0",
+}
 
-@pytest.fixture
-def git_repo(tmp_path: Path) -> Path:
-    """Create a temporary git repository with a fake remote."""
-    repo = tmp_path / "repo"
+
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the repo + fake remote once per session.
+
+    Tests get per-test copies via the git_repo fixture; building the
+    template once avoids re-running the ~8 git commands for every test.
+    """
+    base = tmp_path_factory.mktemp("template")
+    repo = base / "repo"
     repo.mkdir()
-    subprocess.run(["git", "init"], cwd=repo, check=True)
-    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=repo, check=True)
-    subprocess.run(["git", "config", "user.name", "Test"], cwd=repo, check=True)
+    subprocess.run(["git", "init", "-b", "main", "-q", "--template="], cwd=repo, check=True, env=_GIT_ENV)
+    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=repo, check=True, env=_GIT_ENV)
+    subprocess.run(["git", "config", "user.name", "Test"], cwd=repo, check=True, env=_GIT_ENV)
 
-    remote_repo = tmp_path / "remote.git"
+    remote_repo = base / "remote.git"
     remote_repo.mkdir()
-    subprocess.run(["git", "init", "--bare"], cwd=remote_repo, check=True)
+    subprocess.run(["git", "init", "--bare", "-q", "--template="], cwd=remote_repo, check=True, env=_GIT_ENV)
 
-    subprocess.run(["git", "remote", "add", "origin", str(remote_repo)], cwd=repo, check=True)
+    subprocess.run(["git", "remote", "add", "origin", str(remote_repo)], cwd=repo, check=True, env=_GIT_ENV)
 
     (repo / "README.md").write_text("# Test", encoding="utf-8")
-    subprocess.run(["git", "add", "."], cwd=repo, check=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=repo, check=True)
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, env=_GIT_ENV)
+    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=repo, check=True, env=_GIT_ENV)
+
+    subprocess.run(["git", "checkout", "-b", "develop"], cwd=repo, check=True, env=_GIT_ENV)
+    subprocess.run(["git", "checkout", "main"], cwd=repo, check=True, env=_GIT_ENV)
+
+    return base
 
-    subprocess.run(["git", "checkout", "-b", "develop"], cwd=repo, check=True)
-    subprocess.run(["git", "checkout", "main"], cwd=repo, check=True)
+
+@pytest.fixture
+def git_repo(_git_repo_template: Path, tmp_path: Path) -> Path:
+    """Create a temporary git repository with a fake remote."""
+    repo = tmp_path / "repo"
+    remote_repo = tmp_path / "remote.git"
+    shutil.copytree(_git_repo_template / "repo", repo, symlinks=True)
+    shutil.copytree(_git_repo_template / "remote.git", remote_repo, symlinks=True)
+
+    # Point origin at this test's copy of the remote, not the template's.
+    config = repo / ".git" / "config"
+    config.write_text(
+        config.read_text(encoding="utf-8").replace(
+            str(_git_repo_template / "remote.git"), str(remote_repo)
+        ),
+        encoding="utf-8",
+    )
 
     return repo
+
+
+@pytest.fixture
+def my_feature_worktree(git_repo: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create the my-feature worktree that most delete tests start from."""
+    from typer.testing import CliRunner
+
+    from wt.cli import app
+
+    monkeypatch.chdir(git_repo)
+    result = CliRunner().invoke(app, ["new", "my-feature", "--no-ai", "--no-push"])
+    assert result.exit_code == 0, result.output
+    worktree_path = git_repo / ".wt" / "worktrees" / "my-feature"
+    assert worktree_path.exists()
+    return worktree_path
@@ -3,88 +3,66 @@
 from __future__ import annotations
 
 import json
-import shutil
 import subprocess
 from pathlib import Path
-from unittest.mock import patch
 
+import pytest
 from typer.testing import CliRunner
 
 from wt.cli import app
 
+from _gitutil import branch_exists, remote_branch_exists
+
 runner = CliRunner()
 
 
-def test_delete_by_name(git_repo: Path, monkeypatch) -> None:
-    """Delete worktree by name from base branch."""
+@pytest.fixture
+def stale_worktree(git_repo: Path, monkeypatch) -> Path:
+    """Create a worktree whose directory has been removed out-of-band."""
     monkeypatch.chdir(git_repo)
+    result = runner.invoke(app, ["new", "stale-feature", "--no-ai", "--no-push"])
+    assert result.exit_code == 0, result.output
 
-    result = runner.invoke(app, ["new", "my-feature", "--no-ai", "--no-push"])
-    assert result.exit_code == 0
-
-    worktree_path = git_repo / ".wt" / "worktrees" / "my-feature"
+    worktree_path = git_repo / ".wt" / "worktrees" / "stale-feature"
     assert worktree_path.exists()
 
-    result = runner.invoke(app, ["delete", "my-feature", "--force"])
+    # Simulate external deletion of the worktree directory. A rename out
+    # of the way is O(1) vs. rmtree's per-file unlinks; the destination
+    # lives under tmp_path so pytest cleans it up.
+    worktree_path.rename(git_repo / "stale-feature.gone")
+    assert not worktree_path.exists()
+    return worktree_path
+
+
+@pytest.mark.parametrize("delete_arg", ["my-feature", "feature/my-feature"])
+def test_delete_by_name(
+    git_repo: Path, my_feature_worktree: Path, delete_arg: str
+) -> None:
+    """Delete worktree by feature name or branch name from base branch."""
+    result = runner.invoke(app, ["delete", delete_arg, "--force"])
     assert result.exit_code == 0
     assert "Deleted" in result.stdout
 
-    assert not worktree_path.exists()
+    assert not my_feature_worktree.exists()
 
-    branch_list = subprocess.run(
-        ["git", "branch", "--list", "feature/my-feature"],
-        cwd=git_repo,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    assert branch_list.stdout.strip() == ""
+    assert not branch_exists(git_repo, "feature/my-feature")
 
     state_path = git_repo / ".wt" / "state.json"
     state = json.loads(state_path.read_text(encoding="utf-8"))
     assert state["worktrees"] == []
 
 
-def test_delete_by_branch_name(git_repo: Path, monkeypatch) -> None:
-    """Delete worktree by branch name from base branch."""
-    monkeypatch.chdir(git_repo)
-
-    result = runner.invoke(app, ["new", "my-feature", "--no-ai", "--no-push"])
-    assert result.exit_code == 0
-
-    worktree_path = git_repo / ".wt" / "worktrees" / "my-feature"
-    assert worktree_path.exists()
-
-    result = runner.invoke(app, ["delete", "feature/my-feature", "--force"])
-    assert result.exit_code == 0
-
-    assert not worktree_path.exists()
-
-
-def test_delete_from_worktree(git_repo: Path, monkeypatch) -> None:
+def test_delete_from_worktree(
+    git_repo: Path, my_feature_worktree: Path, monkeypatch
+) -> None:
     """Delete current worktree when running from within it (backward compat)."""
-    monkeypatch.chdir(git_repo)
-
-    result = runner.invoke(app, ["new", "my-feature", "--no-ai", "--no-push"])
-    assert result.exit_code == 0
-
-    worktree_path = git_repo / ".wt" / "worktrees" / "my-feature"
-    assert worktree_path.exists()
-
-    monkeypatch.chdir(worktree_path)
+    monkeypatch.chdir(my_feature_worktree)
     result = runner.invoke(app, ["delete", "--force"])
     assert result.exit_code == 0
 
-    assert not worktree_path.exists()
+    assert not my_feature_worktree.exists()
 
-    branch_list = subprocess.run(
-        ["git", "branch", "--list", "feature/my-feature"],
-        cwd=git_repo,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    assert branch_list.stdout.strip() == ""
+    assert not branch_exists(git_repo, "feature/my-feature")
 
 
 def test_delete_name_not_found(git_repo: Path, monkeypatch) -> None:
@@ -96,30 +74,21 @@ def test_delete_name_not_found(git_repo: Path, monkeypatch) -> None:
     assert "not found" in result.stdout.lower()
 
 
-def test_delete_non_tty_requires_name(git_repo: Path, monkeypatch) -> None:
+def test_delete_non_tty_requires_name(
+    git_repo: Path, my_feature_worktree: Path
+) -> None:
     """Error when no TTY and no name provided."""
-    monkeypatch.chdir(git_repo)
-
-    result = runner.invoke(app, ["new", "my-feature", "--no-ai", "--no-push"])
-    assert result.exit_code == 0
-
     result = runner.invoke(app, ["delete"])
     assert result.exit_code != 0
     assert "required" in result.stdout.lower() or "name" in result.stdout.lower()
 
 
-def test_delete_force_bypasses_checks(git_repo: Path, monkeypatch) -> None:
+def test_delete_force_bypasses_checks(
+    git_repo: Path, my_feature_worktree: Path
+) -> None:
     """Force flag bypasses uncommitted/unpushed checks."""
-    monkeypatch.chdir(git_repo)
-
-    result = runner.invoke(app, ["new", "my-feature", "--no-ai", "--no-push"])
-    assert result.exit_code == 0
-
-    worktree_path = git_repo / ".wt" / "worktrees" / "my-feature"
-    assert worktree_path.exists()
-
-    (worktree_path / "feature.txt").write_text("hello\n", encoding="utf-8")
-    subprocess.run(["git", "add", "feature.txt"], cwd=worktree_path, check=True)
+    (my_feature_worktree / "feature.txt").write_text("hello\n", encoding="utf-8")
+    subprocess.run(["git", "add", "feature.txt"], cwd=my_feature_worktree, check=True)
 
     result = runner.invoke(app, ["delete", "my-feature"])
     assert result.exit_code != 0
@@ -127,7 +96,7 @@ def test_delete_force_bypasses_checks(git_repo: Path, monkeypatch) -> None:
 
     result = runner.invoke(app, ["delete", "my-feature", "--force"])
     assert result.exit_code == 0
-    assert not worktree_path.exists()
+    assert not my_feature_worktree.exists()
 
 
 def test_delete_with_remote_flag(git_repo: Path, monkeypatch) -> None:
@@ -145,30 +114,13 @@ def test_delete_with_remote_flag(git_repo: Path, monkeypatch) -> None:
 
     assert not worktree_path.exists()
 
-    remote_branches = subprocess.run(
-        ["git", "branch", "--remotes"],
-        cwd=git_repo,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    assert "feature/my-feature" not in remote_branches.stdout
+    assert not remote_branch_exists(git_repo, "feature/my-feature")
 
 
-def test_delete_stale_worktree_missing_path(git_repo: Path, monkeypatch) -> None:
+def test_delete_stale_worktree_missing_path(
+    git_repo: Path, stale_worktree: Path
+) -> None:
     """Delete worktree when path has been manually removed from disk."""
-    monkeypatch.chdir(git_repo)
-
-    result = runner.invoke(app, ["new", "stale-feature", "--no-ai", "--no-push"])
-    assert result.exit_code == 0
-
-    worktree_path = git_repo / ".wt" / "worktrees" / "stale-feature"
-    assert worktree_path.exists()
-
-    # Simulate external deletion of the worktree directory.
-    shutil.rmtree(worktree_path)
-    assert not worktree_path.exists()
-
     # Should succeed without --force (checks are skipped for missing paths).
     result = runner.invoke(app, ["delete", "stale-feature"])
     assert result.exit_code == 0
@@ -178,27 +130,14 @@ def test_delete_stale_worktree_missing_path(git_repo: Path, monkeypatch) -> None
     state = json.loads(state_path.read_text(encoding="utf-8"))
     assert state["worktrees"] == []
 
-    branch_list = subprocess.run(
-        ["git", "branch", "--list", "feature/stale-feature"],
-        cwd=git_repo,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    assert branch_list.stdout.strip() == ""
+    assert not branch_exists(git_repo, "feature/stale-feature")
 
 
-def test_delete_stale_worktree_with_force(git_repo: Path, monkeypatch) -> None:
+def test_delete_stale_worktree_with_force(
+    git_repo: Path, stale_worktree: Path
+) -> None:
     """Delete stale worktree with --force flag."""
-    monkeypatch.chdir(git_repo)
-
-    result = runner.invoke(app, ["new", "stale-force", "--no-ai", "--no-push"])
-    assert result.exit_code == 0
-
-    worktree_path = git_repo / ".wt" / "worktrees" / "stale-force"
-    shutil.rmtree(worktree_path)
-
-    result = runner.invoke(app, ["delete", "stale-force", "--force"])
+    result = runner.invoke(app, ["delete", "stale-feature", "--force"])
     assert result.exit_code == 0
 
     state_path = git_repo / ".wt" / "state.json"
@@ -214,19 +153,12 @@ def test_delete_stale_worktree_with_remote(git_repo: Path, monkeypatch) -> None:
     assert result.exit_code == 0
 
     worktree_path = git_repo / ".wt" / "worktrees" / "stale-remote"
-    shutil.rmtree(worktree_path)
+    worktree_path.rename(git_repo / "stale-remote.gone")
 
     result = runner.invoke(app, ["delete", "stale-remote", "--remote", "--force"])
     assert result.exit_code == 0
 
-    remote_branches = subprocess.run(
-        ["git", "branch", "--remotes"],
-        cwd=git_repo,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    assert "feature/stale-remote" not in remote_branches.stdout
+    assert not remote_branch_exists(git_repo, "feature/stale-remote")
 
 
 def test_delete_no_worktrees_from_base(git_repo: Path, monkeypatch) -> None:
@@ -1,4 +1,5 @@
 """Tests for wt.git module."""
+from pathlib import Path
 from subprocess import CompletedProcess
 
 import wt.git as git
@@ -51,3 +52,56 @@ def test_remote_exists_returns_false_when_remote_missing(monkeypatch) -> None:
     monkeypatch.setattr(git, "run_git", fake_run_git)
 
     assert git.remote_exists("origin") is False
+
+
+def test_fetch_branches_batches_refspecs_per_remote(monkeypatch) -> None:
+    calls = []
+
+    def fake_run_git(*args, **kwargs):
+        calls.append(args)
+        return CompletedProcess(args=["git", *args], returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(git, "run_git", fake_run_git)
+
+    ok = git.fetch_branches(
+        [
+            ("origin", "feature/a"),
+            ("origin", "feature/b"),
+            ("origin", "feature/a"),  # duplicate collapses
+            ("upstream", "main"),
+        ]
+    )
+
+    assert ok is True
+    assert sorted(calls) == [
+        ("fetch", "origin", "feature/a:feature/a", "feature/b:feature/b"),
+        ("fetch", "upstream", "main:main"),
+    ]
+
+
+def test_fetch_branches_returns_false_when_any_remote_fails(monkeypatch) -> None:
+    def fake_run_git(*args, **kwargs):
+        returncode = 128 if args[1] == "upstream" else 0
+        return CompletedProcess(
+            args=["git", *args], returncode=returncode, stdout="", stderr=""
+        )
+
+    monkeypatch.setattr(git, "run_git", fake_run_git)
+
+    assert git.fetch_branches([("origin", "feature/a"), ("upstream", "main")]) is False
+
+
+def test_fetch_branches_empty_is_success(monkeypatch) -> None:
+    def fake_run_git(*args, **kwargs):  # pragma: no cover - must not be called
+        raise AssertionError("fetch_branches([]) should not spawn git")
+
+    monkeypatch.setattr(git, "run_git", fake_run_git)
+
+    assert git.fetch_branches([]) is True
+
+
+def test_git_batch_answers_multiple_ref_probes(git_repo: Path) -> None:
+    with git.GitBatch(cwd=git_repo) as batch:
+        assert batch.branch_exists("main") is True
+        assert batch.branch_exists("develop") is True
+        assert batch.branch_exists("no-such-branch") is False
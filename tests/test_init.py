@@ -3,18 +3,37 @@
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
 from wt.init import InitContext, build_init_env, resolve_init_script, run_init_script
 
 
+@pytest.fixture
+def make_ctx(tmp_path: Path):
+    """Factory for InitContext instances with sensible defaults."""
+    worktree_path = tmp_path / "worktree"
+    worktree_path.mkdir()
+
+    def _make(**overrides) -> InitContext:
+        defaults = dict(
+            wt_root=tmp_path / ".wt",
+            repo_root=tmp_path,
+            worktree_path=worktree_path,
+            feat_name="feat",
+            branch="feature/feat",
+            base_branch="develop",
+        )
+        return InitContext(**{**defaults, **overrides})
+
+    return _make
+
+
 class TestBuildInitEnv:
-    def test_builds_env_with_context(self) -> None:
-        ctx = InitContext(
+    def test_builds_env_with_context(self, make_ctx) -> None:
+        ctx = make_ctx(
             wt_root=Path("/repo/.wt"),
             repo_root=Path("/repo"),
             worktree_path=Path("/repo/.wt/worktrees/feat"),
-            feat_name="feat",
-            branch="feature/feat",
-            base_branch="develop",
         )
         env = build_init_env(ctx)
 
@@ -25,17 +44,9 @@ class TestBuildInitEnv:
         assert env["WT_BRANCH"] == "feature/feat"
         assert env["WT_BASE_BRANCH"] == "develop"
 
-    def test_preserves_existing_env(self, monkeypatch) -> None:
+    def test_preserves_existing_env(self, make_ctx, monkeypatch) -> None:
         monkeypatch.setenv("MY_VAR", "my_value")
-        ctx = InitContext(
-            wt_root=Path("/repo/.wt"),
-            repo_root=Path("/repo"),
-            worktree_path=Path("/repo/.wt/worktrees/feat"),
-            feat_name="feat",
-            branch="feature/feat",
-            base_branch="develop",
-        )
-        env = build_init_env(ctx)
+        env = build_init_env(make_ctx())
 
         assert env["MY_VAR"] == "my_value"
         assert env["WT_FEAT_NAME"] == "feat"
@@ -80,72 +91,29 @@ class TestResolveInitScript:
 
 
 class TestRunInitScript:
-    def test_successful_script(self, tmp_path) -> None:
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-
-        ctx = InitContext(
-            wt_root=tmp_path / ".wt",
-            repo_root=tmp_path,
-            worktree_path=worktree_path,
-            feat_name="feat",
-            branch="feature/feat",
-            base_branch="develop",
-        )
+    def test_successful_script(self, make_ctx) -> None:
         console = MagicMock()
 
-        result = run_init_script("true", ctx, console, strict=False)
+        result = run_init_script("true", make_ctx(), console, strict=False)
         assert result is True
 
-    def test_failing_script_non_strict(self, tmp_path) -> None:
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-
-        ctx = InitContext(
-            wt_root=tmp_path / ".wt",
-            repo_root=tmp_path,
-            worktree_path=worktree_path,
-            feat_name="feat",
-            branch="feature/feat",
-            base_branch="develop",
-        )
+    def test_failing_script_non_strict(self, make_ctx) -> None:
         console = MagicMock()
 
         # Non-strict mode should return True even on failure
-        result = run_init_script("false", ctx, console, strict=False)
+        result = run_init_script("false", make_ctx(), console, strict=False)
         assert result is True
 
-    def test_failing_script_strict(self, tmp_path) -> None:
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-
-        ctx = InitContext(
-            wt_root=tmp_path / ".wt",
-            repo_root=tmp_path,
-            worktree_path=worktree_path,
-            feat_name="feat",
-            branch="feature/feat",
-            base_branch="develop",
-        )
+    def test_failing_script_strict(self, make_ctx) -> None:
         console = MagicMock()
 
         # Strict mode should return False on failure
-        result = run_init_script("false", ctx, console, strict=True)
+        result = run_init_script("false", make_ctx(), console, strict=True)
         assert result is False
 
-    def test_script_receives_env_vars(self, tmp_path) -> None:
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-        output_file = worktree_path / "output.txt"
-
-        ctx = InitContext(
-            wt_root=tmp_path / ".wt",
-            repo_root=tmp_path,
-            worktree_path=worktree_path,
-            feat_name="my-feature",
-            branch="feature/my-feature",
-            base_branch="main",
-        )
+    def test_script_receives_env_vars(self, make_ctx) -> None:
+        ctx = make_ctx(feat_name="my-feature", base_branch="main")
+        output_file = ctx.worktree_path / "output.txt"
         console = MagicMock()
 
         # Script that writes env vars to a file
@@ -155,23 +123,13 @@ class TestRunInitScript:
         assert result is True
         assert output_file.read_text().strip() == "my-feature:main"
 
-    def test_script_runs_in_worktree_dir(self, tmp_path) -> None:
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-        output_file = tmp_path / "pwd_output.txt"
-
-        ctx = InitContext(
-            wt_root=tmp_path / ".wt",
-            repo_root=tmp_path,
-            worktree_path=worktree_path,
-            feat_name="feat",
-            branch="feature/feat",
-            base_branch="develop",
-        )
+    def test_script_runs_in_worktree_dir(self, make_ctx) -> None:
+        ctx = make_ctx()
+        output_file = ctx.repo_root / "pwd_output.txt"
         console = MagicMock()
 
         script = f"pwd > {output_file}"
         result = run_init_script(script, ctx, console, strict=False)
 
         assert result is True
-        assert output_file.read_text().strip() == str(worktree_path)
+        assert output_file.read_text().strip() == str(ctx.worktree_path)
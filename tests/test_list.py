@@ -6,7 +6,6 @@ import subprocess
 from pathlib import Path
 from subprocess import CompletedProcess
 
-import pytest
 from typer.testing import CliRunner
 
 from wt.cli import app
@@ -41,6 +40,19 @@ def test_version_bypasses_sync(tmp_path: Path, monkeypatch) -> None:
     assert "wt version" in result.stdout
 
 
+def test_cwd_option_switches_directory(git_repo: Path, tmp_path: Path, monkeypatch) -> None:
+    """--cwd runs the command as if invoked from that directory."""
+    # Start outside any repo; monkeypatch restores the cwd --cwd changes.
+    monkeypatch.chdir(tmp_path)
+    setup_state(git_repo, [])
+
+    result = runner.invoke(app, ["--cwd", str(git_repo), "list"])
+
+    # The repo-scoped error proves the command ran against git_repo.
+    assert result.exit_code != 0
+    assert "no worktrees" in result.stdout.lower()
+
+
 class TestList:
     def test_list_shows_worktrees(self, git_repo: Path, monkeypatch) -> None:
         worktree_path = git_repo / ".wt/worktrees/my-feature"
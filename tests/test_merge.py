@@ -6,44 +6,38 @@ import json
 import subprocess
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from wt.cli import app
 
-runner = CliRunner()
-
-
-def test_merge_merges_into_base_and_deletes_worktree(
-    git_repo: Path, monkeypatch
-) -> None:
-    monkeypatch.chdir(git_repo)
+from _gitutil import branch_exists
 
-    result = runner.invoke(app, ["new", "my-feature", "--no-ai", "--no-push"])
-    assert result.exit_code == 0
+runner = CliRunner()
 
-    worktree_path = git_repo / ".wt" / "worktrees" / "my-feature"
-    assert worktree_path.exists()
 
-    (worktree_path / "feature.txt").write_text("hello\n", encoding="utf-8")
-    subprocess.run(["git", "add", "feature.txt"], cwd=worktree_path, check=True)
+@pytest.fixture
+def mergeable_worktree(my_feature_worktree: Path) -> Path:
+    """A worktree with one committed change, ready to merge into base."""
+    (my_feature_worktree / "feature.txt").write_text("hello\n", encoding="utf-8")
+    subprocess.run(["git", "add", "feature.txt"], cwd=my_feature_worktree, check=True)
     subprocess.run(
-        ["git", "commit", "-m", "Add feature"], cwd=worktree_path, check=True
+        ["git", "commit", "-m", "Add feature"], cwd=my_feature_worktree, check=True
     )
+    return my_feature_worktree
+
 
+def test_merge_merges_into_base_and_deletes_worktree(
+    git_repo: Path, mergeable_worktree: Path, monkeypatch
+) -> None:
+    worktree_path = mergeable_worktree
     monkeypatch.chdir(worktree_path)
     result = runner.invoke(app, ["merge", "--no-push"])
     assert result.exit_code == 0
 
     assert not worktree_path.exists()
 
-    branch_list = subprocess.run(
-        ["git", "branch", "--list", "feature/my-feature"],
-        cwd=git_repo,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    assert branch_list.stdout.strip() == ""
+    assert not branch_exists(git_repo, "feature/my-feature")
 
     # Base branch is now the current branch at init time (main), not hard-coded "develop"
     subprocess.run(["git", "checkout", "main"], cwd=git_repo, check=True)
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import json
-import subprocess
 from pathlib import Path
 
+import pytest
 import typer
 from typer.testing import CliRunner
 
@@ -13,40 +13,63 @@ from wt.cli import app
 runner = CliRunner()
 
 
+try:  # Same optional speedup the CLI uses for state files.
+    import orjson
+except ImportError:
+    orjson = None
+
+
 def setup_state(repo: Path, worktrees: list[dict]) -> None:
     """Create .wt/state.json with provided worktrees."""
     wt_dir = repo / ".wt"
     wt_dir.mkdir(parents=True, exist_ok=True)
     state_path = wt_dir / "state.json"
-    state_path.write_text(json.dumps({"worktrees": worktrees}), encoding="utf-8")
-
-
-def add_git_worktree(repo: Path, worktree_path: Path, branch: str, base: str = "develop") -> None:
-    """Register a git worktree so pre-command sync keeps state."""
-    worktree_path.parent.mkdir(parents=True, exist_ok=True)
-    subprocess.run(
-        ["git", "worktree", "add", "-b", branch, str(worktree_path), base],
-        cwd=repo,
-        check=True,
+    payload = {"worktrees": worktrees}
+    if orjson is not None:
+        state_path.write_bytes(orjson.dumps(payload))
+    else:
+        state_path.write_bytes(json.dumps(payload).encode("utf-8"))
+
+
+@pytest.fixture
+def feature_worktree(git_repo: Path, monkeypatch) -> Path:
+    """Register the my-feature worktree in state.json and fake git's view.
+
+    The path command only reads state, so pre-command sync is satisfied
+    with a stubbed worktree_list instead of a real `git worktree add`
+    fork. Real-worktree sync behavior is covered in test_list.py.
+    """
+    import wt.git
+
+    worktree_path = git_repo / ".wt/worktrees/my-feature"
+    setup_state(
+        git_repo,
+        [
+            {
+                "feat_name": "my-feature",
+                "branch": "feature/my-feature",
+                "path": str(worktree_path),
+                "base": "develop",
+                "created_at": "2026-01-01T00:00:00",
+            }
+        ],
+    )
+    monkeypatch.setattr(
+        wt.git,
+        "worktree_list",
+        lambda cwd=None: [
+            {"path": str(git_repo), "branch": "main"},
+            {"path": str(worktree_path), "branch": "feature/my-feature"},
+        ],
     )
+    return worktree_path
 
 
 class TestPathByName:
-    def test_success(self, git_repo: Path, monkeypatch) -> None:
-        worktree_path = git_repo / ".wt/worktrees/my-feature"
-        setup_state(
-            git_repo,
-            [
-                {
-                    "feat_name": "my-feature",
-                    "branch": "feature/my-feature",
-                    "path": str(worktree_path),
-                    "base": "develop",
-                    "created_at": "2026-01-01T00:00:00",
-                }
-            ],
-        )
-        add_git_worktree(git_repo, worktree_path, "feature/my-feature")
+    def test_success(
+        self, git_repo: Path, feature_worktree: Path, monkeypatch
+    ) -> None:
+        worktree_path = feature_worktree
         monkeypatch.chdir(git_repo)
 
         result = runner.invoke(app, ["path", "my-feature"])
@@ -74,21 +97,10 @@ class TestPathNoArgs:
         assert result.exit_code != 0
         assert "no worktrees" in result.stdout.lower()
 
-    def test_interactive_stdout_only_path(self, git_repo: Path, monkeypatch) -> None:
-        worktree_path = git_repo / ".wt/worktrees/my-feature"
-        setup_state(
-            git_repo,
-            [
-                {
-                    "feat_name": "my-feature",
-                    "branch": "feature/my-feature",
-                    "path": str(worktree_path),
-                    "base": "develop",
-                    "created_at": "2026-01-01T00:00:00",
-                }
-            ],
-        )
-        add_git_worktree(git_repo, worktree_path, "feature/my-feature")
+    def test_interactive_stdout_only_path(
+        self, git_repo: Path, feature_worktree: Path, monkeypatch
+    ) -> None:
+        worktree_path = feature_worktree
         monkeypatch.chdir(git_repo)
         monkeypatch.setattr(typer, "prompt", lambda *args, **kwargs: 1)
 
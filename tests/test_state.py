@@ -1,7 +1,25 @@
 """Tests for wt.state module."""
+import pytest
+
 from wt.state import WorktreeEntry, WtState
 
 
+def make_state(count: int) -> WtState:
+    """Build an in-memory state with count worktree entries."""
+    return WtState(
+        worktrees=[
+            WorktreeEntry(
+                feat_name=f"feat-{i}",
+                branch=f"feature/feat-{i}",
+                path=f"/repo/.wt/worktrees/feat-{i}",
+                base="develop",
+                created_at="2026-01-01T00:00:00",
+            )
+            for i in range(count)
+        ]
+    )
+
+
 class TestWtStateFindByFeatName:
     def test_find_existing(self) -> None:
         state = WtState(
@@ -23,3 +41,17 @@ class TestWtStateFindByFeatName:
         state = WtState(worktrees=[])
         entry = state.find_by_feat_name("nonexistent")
         assert entry is None
+
+    @pytest.mark.parametrize("count", [1, 4, 100])
+    def test_lookup_at_scale(self, count: int) -> None:
+        """Lookups stay correct (and indexed) as the entry list grows."""
+        state = make_state(count)
+
+        last = state.find_by_feat_name(f"feat-{count - 1}")
+        assert last is not None
+        assert last.path == f"/repo/.wt/worktrees/feat-{count - 1}"
+        assert state.find_by_feat_name(f"feat-{count}") is None
+
+        # Mutations must invalidate the index, not serve stale entries.
+        state.remove_worktree("/repo/.wt/worktrees/feat-0")
+        assert state.find_by_feat_name("feat-0") is None
@@ -6,14 +6,17 @@ from wt.utils import derive_feat_name_from_branch, normalize_feat_name
 
 
 class TestNormalizeFeatName:
-    def test_lowercase(self) -> None:
-        assert normalize_feat_name("MyFeature") == "myfeature"
-
-    def test_spaces_to_dashes(self) -> None:
-        assert normalize_feat_name("my feature") == "my-feature"
-
-    def test_valid_chars(self) -> None:
-        assert normalize_feat_name("feat-1.0_test") == "feat-1.0_test"
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("MyFeature", "myfeature"),
+            ("my feature", "my-feature"),
+            ("feat-1.0_test", "feat-1.0_test"),
+        ],
+        ids=["lowercase", "spaces-to-dashes", "valid-chars"],
+    )
+    def test_normalize(self, name: str, expected: str) -> None:
+        assert normalize_feat_name(name) == expected
 
     def test_invalid_chars_raises(self) -> None:
         with pytest.raises(InvalidFeatureNameError):
@@ -21,8 +24,13 @@ class TestNormalizeFeatName:
 
 
 class TestDeriveFeatName:
-    def test_strips_prefix(self) -> None:
-        assert derive_feat_name_from_branch("feature/billing", "feature/") == "billing"
-
-    def test_no_prefix(self) -> None:
-        assert derive_feat_name_from_branch("billing", "feature/") == "billing"
+    @pytest.mark.parametrize(
+        ("branch", "expected"),
+        [
+            ("feature/billing", "billing"),
+            ("billing", "billing"),
+        ],
+        ids=["strips-prefix", "no-prefix"],
+    )
+    def test_derive(self, branch: str, expected: str) -> None:
+        assert derive_feat_name_from_branch(branch, "feature/") == expected